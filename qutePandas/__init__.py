@@ -1,5 +1,7 @@
+import importlib
 import os
 import sys
+import types
 
 def _setup_pykx_environment():
     """
@@ -53,6 +55,12 @@ def _setup_pykx_environment():
     if not license_found and 'PYKX_UNLICENSED' not in os.environ:
         os.environ['PYKX_UNLICENSED'] = 'true'
     
+    # q fixes the maximum number of secondary threads (used by peach) at startup.
+    threads = os.environ.get('QUTEPANDAS_THREADS', '').strip()
+    qargs = os.environ.get('QARGS', '')
+    if threads.isdigit() and '-s' not in qargs.split():
+        os.environ['QARGS'] = f"{qargs} -s {threads}".strip()
+
     if 'PYKX_RELEASE_GIL' not in os.environ:
         os.environ['PYKX_RELEASE_GIL'] = 'true'
     
@@ -61,32 +69,101 @@ def _setup_pykx_environment():
 
 _setup_pykx_environment()
 
-from .core.dataframe import DataFrame
-from .core.connection import connect, get_license_info, install_license
-from .core.display import py, np, pd, pa, pt, print
+__version__ = "1.1.4"
+
+# Public API, resolved on first access so that ``import qutePandas`` does not
+# import pykx, pandas or pyarrow until a function is actually used.
+_LAZY_ATTRS = {
+    'DataFrame': '.core.dataframe',
+    'connect': '.core.connection',
+    'get_license_info': '.core.connection',
+    'install_license': '.core.connection',
+    'set_threads': '.core.connection',
+    'py': '.core.display',
+    'np': '.core.display',
+    'pd': '.core.display',
+    'pa': '.core.display',
+    'pt': '.core.display',
+    'print': '.core.display',
+    'LazyFrame': '.core.lazy',
+    'lazy': '.core.lazy',
+    'LazyDataFrame': '.core.proxy',
+    'RemoteSession': '.core.remote',
+    'PartitionedTable': '.core.partitioned',
+    'enable_conversion_cache': '.core.cache',
+    'disable_conversion_cache': '.core.cache',
+    'clear_conversion_cache': '.core.cache',
+    'conversion_cache_info': '.core.cache',
+    'heap_stats': '.core.memory',
+    'gc': '.core.memory',
+    'set_gc_policy': '.core.memory',
+    'profile': '.core.profiling',
+    'Profiler': '.core.profiling',
+    'add_hook': '.core.profiling',
+    'remove_hook': '.core.profiling',
+
+    'dropna': '.cleaning.dropna',
+    'dropna_col': '.cleaning.dropna_col',
+    'fillna': '.cleaning.fillna',
+    'remove_duplicates': '.cleaning.remove_duplicates',
+    'duplicated': '.cleaning.duplicated',
+    'interpolate': '.cleaning.interpolate',
+
+    'cast': '.transformation.cast',
+    'drop_col': '.transformation.drop_col',
+    'rename': '.transformation.rename',
+
+    'merge': '.joining.merge',
+
+    'groupby_sum': '.grouping.groupby_sum',
+    'groupby_avg': '.grouping.groupby_avg',
+    'groupby_chunked': '.grouping.groupby_chunked',
+
+    'to_csv': '.io.to_csv',
+    'from_csv': '.io.from_csv',
+    'to_kdb': '.io.to_kdb',
+    'from_kdb': '.io.from_kdb',
+    'to_partitioned': '.io.to_partitioned',
+    'from_partitioned': '.io.from_partitioned',
+    'to_parquet': '.io.to_parquet',
+    'from_parquet': '.io.from_parquet',
+    'to_arrow_ipc': '.io.to_arrow_ipc',
+    'from_arrow_ipc': '.io.from_arrow_ipc',
+
+    'apply': '.apply.apply',
+    'apply_col': '.apply.apply_col',
+
+    'dtypes': '.introspection.dtypes',
+    'memory_usage': '.introspection.memory_usage',
+
+    'loc': '.indexing.loc',
+    'iloc': '.indexing.iloc',
+}
 
-from .cleaning.dropna import dropna
-from .cleaning.dropna_col import dropna_col
-from .cleaning.fillna import fillna
-from .cleaning.remove_duplicates import remove_duplicates
+__all__ = list(_LAZY_ATTRS)
 
-from .transformation.cast import cast
-from .transformation.drop_col import drop_col
-from .transformation.rename import rename
+# Submodules reachable as attributes without an explicit import (qpd.aio).
+_LAZY_SUBMODULES = ('aio',)
 
-from .joining.merge import merge
 
-from .grouping.groupby_sum import groupby_sum
-from .grouping.groupby_avg import groupby_avg
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
 
-from .io.to_csv import to_csv
-from .io.from_csv import from_csv
+    path = _LAZY_ATTRS.get(name)
+    if path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .apply.apply import apply
-from .apply.apply_col import apply_col
+    value = getattr(importlib.import_module(path, __name__), name)
+    globals()[name] = value
 
-from .introspection.dtypes import dtypes
+    # Importing a subpackage binds it as an attribute of this package, which
+    # shadows a public function of the same name (qutePandas.apply).
+    for other, other_path in _LAZY_ATTRS.items():
+        if isinstance(globals().get(other), types.ModuleType):
+            globals()[other] = getattr(importlib.import_module(other_path, __name__), other)
+    return value
 
-from .indexing import loc, iloc
 
-__version__ = "1.1.4"
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
@@ -0,0 +1,295 @@
+"""
+asyncio variants of the qutePandas functions.
+
+Every public operation has a coroutine counterpart taking the same
+arguments plus a keyword-only ``timeout`` in seconds:
+
+    res = await qpd.aio.groupby_sum(df, 'sym', 'qty', return_type='p', timeout=5)
+
+Embedded q calls run on one dedicated worker thread so the event loop stays
+responsive while pandas conversion and the q query execute; q is
+single-threaded, so embedded calls are queued rather than run side by side.
+PyKX only accepts q calls from a non-main thread when ``PYKX_THREADING`` is
+set before pykx is first imported.
+
+Remote sessions opened with ``await qpd.aio.connect(host, port)`` use
+``pykx.AsyncQConnection`` and overlap requests across a pool of
+connections.
+
+Cancelling (or timing out) a call that is still queued drops it. An embedded
+call that q has already started runs to completion and its result is
+discarded. A cancelled remote call closes its connection, so a late reply
+cannot be read by the next request.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+_FUNCTIONS = (
+    'DataFrame', 'dropna', 'dropna_col', 'fillna', 'remove_duplicates', 'duplicated',
+    'interpolate', 'cast', 'drop_col', 'rename', 'merge', 'groupby_sum', 'groupby_avg',
+    'groupby_chunked', 'to_csv', 'from_csv', 'to_kdb', 'from_kdb',
+    'to_partitioned', 'from_partitioned', 'to_parquet', 'from_parquet',
+    'to_arrow_ipc', 'from_arrow_ipc', 'apply', 'apply_col', 'dtypes', 'memory_usage',
+    'loc', 'iloc',
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from pykx import config
+            if not config.pykx_threading:
+                raise RuntimeError(
+                    "Embedded async calls need PyKX threading. Set PYKX_THREADING=true "
+                    "before importing qutePandas, or use a remote session from qpd.aio.connect()."
+                )
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='qutePandas-aio')
+    return _executor
+
+
+async def run(func, *args, timeout=None, **kwargs):
+    """
+    Runs a blocking qutePandas callable on the q worker thread.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call, e.g. ``qpd.dropna`` or ``frame.collect``.
+    *args, **kwargs
+        Arguments for func.
+    timeout : float, optional
+        Seconds to wait before raising ``asyncio.TimeoutError``.
+
+    Returns
+    -------
+    object
+        Return value of func.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+    return await asyncio.wait_for(future, timeout)
+
+
+def _async_variant(name):
+    async def variant(*args, timeout=None, **kwargs):
+        import qutePandas
+        return await run(getattr(qutePandas, name), *args, timeout=timeout, **kwargs)
+
+    variant.__name__ = variant.__qualname__ = name
+    variant.__doc__ = (
+        f"Coroutine version of qutePandas.{name}; accepts an extra keyword-only "
+        f"timeout in seconds."
+    )
+    return variant
+
+
+for _name in _FUNCTIONS:
+    globals()[_name] = _async_variant(_name)
+del _name
+
+
+async def collect(frame, return_type='q', timeout=None):
+    """
+    Executes a LazyFrame pipeline without blocking the event loop.
+
+    Pipelines from ``AsyncRemoteSession.table`` run on the server over an
+    async connection; other pipelines run on the q worker thread.
+
+    Parameters
+    ----------
+    frame : LazyFrame
+        Pipeline to execute.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+    timeout : float, optional
+        Seconds to wait before raising ``asyncio.TimeoutError``.
+    """
+    source = frame._source
+    if source is not None and isinstance(source[0], AsyncRemoteSession):
+        import pykx as kx
+        session, name = source
+        q_stages = kx.toq([frame._compile_stage(s) for s in frame._stages])
+        return await session.query('.qpd.lazyRun', kx.SymbolAtom(name), q_stages,
+                                   return_type=return_type, timeout=timeout)
+    return await run(frame.collect, return_type, timeout=timeout)
+
+
+class AsyncRemoteSession:
+    """
+    Pool of ``pykx.AsyncQConnection`` objects to a kdb+ server.
+
+    Returned by ``await qpd.aio.connect(host, port, pool_size=N)``. Up to
+    ``pool_size`` requests are in flight at once; further requests wait for
+    a free connection without blocking the event loop.
+    """
+
+    def __init__(self, host='localhost', port=None, pool_size=1, username='', password='', tls=False):
+        if port is None:
+            raise ValueError("port is required for a remote session")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.host = host
+        self.port = port
+        self.pool_size = pool_size
+        self._conn_kwargs = {'username': username, 'password': password, 'tls': tls}
+        self._idle = []
+        self._slots = asyncio.Semaphore(pool_size)
+        self._closed = False
+
+    async def _new_connection(self):
+        import pykx as kx
+        from .core.remote import _SERVER_SETUP
+        try:
+            conn = await kx.AsyncQConnection(self.host, self.port, **self._conn_kwargs)
+        except Exception as e:
+            raise RuntimeError(f"Failed to connect to kdb+ server at {self.host}:{self.port}: {e}")
+        try:
+            await conn(_SERVER_SETUP)
+        except Exception as e:
+            await conn.close()
+            raise RuntimeError(f"Failed to prepare kdb+ server at {self.host}:{self.port}: {e}")
+        return conn
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Borrows a pooled ``pykx.AsyncQConnection`` for the duration of the block.
+        """
+        import pykx as kx
+        if self._closed:
+            raise RuntimeError("Remote session is closed")
+
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await self._new_connection()
+            try:
+                yield conn
+            except kx.QError:
+                self._idle.append(conn)
+                raise
+            except BaseException:
+                await conn.close()
+                raise
+            else:
+                if self._closed:
+                    await conn.close()
+                else:
+                    self._idle.append(conn)
+
+    async def query(self, expr, *args, return_type='q', timeout=None):
+        """
+        Evaluates a q expression on the server, optionally applied to arguments.
+
+        Parameters
+        ----------
+        expr : str
+            q expression or lambda.
+        *args
+            Arguments passed to the lambda.
+        return_type : str, default 'q'
+            Desired return type ('p', 'q', 'a', 'n' or 'l').
+        timeout : float, optional
+            Seconds to wait before raising ``asyncio.TimeoutError``.
+
+        Converting the reply to pandas, Arrow or NumPy runs on the loop's
+        default executor, so large results do not stall other tasks.
+        """
+        from .utils import _handle_return
+
+        async def send():
+            async with self.connection() as conn:
+                return await conn(expr, *args)
+
+        result = await asyncio.wait_for(send(), timeout)
+        if return_type == 'q':
+            return result
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _handle_return, result, return_type)
+
+    async def tables(self):
+        """
+        Returns the names of the tables defined in the server's root namespace.
+        """
+        return (await self.query('tables[]')).py()
+
+    async def table(self, name):
+        """
+        Starts a LazyFrame pipeline over a named server table.
+
+        Run it with ``await qpd.aio.collect(frame)``.
+        """
+        import pykx as kx
+        from .core.lazy import LazyFrame
+        cols = (await self.query('cols', kx.SymbolAtom(name))).py()
+        return LazyFrame(None, [LazyFrame._new_stage(cols)], source=(self, name))
+
+    def _run_stages(self, name, q_stages):
+        raise RuntimeError("Pipelines from an async session run with: await qpd.aio.collect(frame)")
+
+    async def upload(self, name, df):
+        """
+        Sends a table to the server and assigns it to a global name.
+
+        Converting a pandas DataFrame runs on the loop's default executor,
+        like reply conversion in query.
+        """
+        import pykx as kx
+        from .utils import _ensure_q_table
+        loop = asyncio.get_running_loop()
+        q_table = await loop.run_in_executor(None, _ensure_q_table, df)
+        await self.query('set', kx.SymbolAtom(name), q_table)
+        return name
+
+    async def close(self):
+        """
+        Closes every idle connection. Borrowed connections close when returned.
+        """
+        self._closed = True
+        while self._idle:
+            await self._idle.pop().close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def __repr__(self):
+        state = 'closed' if self._closed else f'{len(self._idle)} idle'
+        return f"<AsyncRemoteSession {self.host}:{self.port} pool_size={self.pool_size} ({state})>"
+
+
+async def connect(host='localhost', port=None, pool_size=1, username='', password='', tls=False):
+    """
+    Opens an asynchronous remote session.
+
+    Parameters
+    ----------
+    host : str, default 'localhost'
+        Server host.
+    port : int
+        Server port.
+    pool_size : int, default 1
+        Maximum number of concurrent requests (pooled connections).
+    username, password : str, optional
+        Server credentials.
+    tls : bool, default False
+        Use a TLS connection.
+
+    Returns
+    -------
+    AsyncRemoteSession
+        Session whose first connection is already open.
+    """
+    session = AsyncRemoteSession(host, port, pool_size=pool_size, username=username, password=password, tls=tls)
+    async with session.connection():
+        pass
+    return session
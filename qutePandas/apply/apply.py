@@ -1,8 +1,9 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
 
 
+@_instrument
 def apply(df, func, axis=0, return_type='q'):
     """
     Applies function to DataFrame along specified axis.
@@ -12,11 +13,13 @@ def apply(df, func, axis=0, return_type='q'):
     df : pandas.DataFrame or pykx.Table
         Input DataFrame.
     func : callable or str
-        Function to apply.
+        Function to apply. With axis=0 a q function string is applied to
+        the columns with peach, so when q runs with secondary threads it
+        must not assign globals.
     axis : int, default 0
         Axis along which to apply function (0=columns, 1=rows).
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -39,10 +42,11 @@ def apply(df, func, axis=0, return_type='q'):
                 return pd.Series(ret) if return_type == 'p' else ret
 
         if isinstance(func, str):
+            q_func = kx.q(func)
             if axis == 1:
-                result = kx.q(f"{{({func}) each x}}", q_table)
+                result = _q_func('each_row')(q_table, q_func)
             else:
-                result = kx.q(f"{{({func}) each flip x}}", q_table)
+                result = _q_func('each_column')(q_table, q_func)
                 
 
         else:
@@ -54,9 +58,10 @@ def apply(df, func, axis=0, return_type='q'):
             else:
                 cols = kx.q("cols", q_table).py()
                 
+                get_col = _q_func('get_col')
                 res_dict = {}
                 for col in cols:
-                    col_data = kx.q(f"{{x`{col}}}", q_table).pd()
+                    col_data = get_col(q_table, kx.SymbolAtom(col)).pd()
                     res_dict[col] = func(col_data)
                     
                 result = kx.toq(res_dict)
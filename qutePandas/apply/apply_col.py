@@ -1,9 +1,10 @@
 import pykx as kx
 import pandas as pd
 import numpy as np
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
 
 
+@_instrument
 def apply_col(df, col, func, return_type='q'):
     """
     Applies function to a single column of DataFrame.
@@ -15,9 +16,12 @@ def apply_col(df, col, func, return_type='q'):
     col : str
         Column name to apply function to.
     func : callable or str
-        Function to apply to the column. If string, applied as q function string.
+        Function to apply to the column. If string, applied as q function
+        string to each element; the column is split into one chunk per
+        secondary thread and the chunks run with peach, so when q runs with
+        secondary threads the function must not assign globals.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -29,10 +33,11 @@ def apply_col(df, col, func, return_type='q'):
         if len(q_table) == 0:
             return _handle_return(q_table, return_type)
         
+        q_col = kx.SymbolAtom(col)
         if isinstance(func, str):
-            result = kx.q(f"{{update {col}:({func}) each {col} from x}}", q_table)
+            result = _q_func('each_col')(q_table, q_col, kx.q(func))
         else:
-            col_data = kx.q(f"{{x`{col}}}", q_table).py()
+            col_data = _q_func('get_col')(q_table, q_col).py()
             
             if hasattr(col_data, 'apply'):
                 new_data = col_data.apply(func)
@@ -42,7 +47,7 @@ def apply_col(df, col, func, return_type='q'):
                 new_data = np.vectorize(func)(col_data)
             
             q_new_data = kx.toq(new_data)
-            result = kx.q(f"{{update {col}:y from x}}", q_table, q_new_data)
+            result = _q_func('set_col')(q_table, q_col, q_new_data)
             
         return _handle_return(result, return_type)
     except Exception as e:
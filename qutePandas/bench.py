@@ -0,0 +1,363 @@
+"""
+Headless benchmark runner for qutePandas.
+
+Times every public function across row counts and column mixes, reports a
+log-log scaling exponent per function, writes JSON and optionally compares
+against a saved baseline, exiting non-zero when a case regresses by more
+than the threshold.
+
+    python -m qutePandas.bench --rows 1e3,1e4,1e5,1e6 --output bench.json
+    python -m qutePandas.bench --baseline bench.json --threshold 0.2
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import qutePandas as qpd
+
+_LETTERS = np.array(list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+# Column kinds cycled through for each mix.
+MIXES = {
+    'mixed': ('int', 'float', 'symbol', 'category', 'normal'),
+    'numeric': ('int', 'float', 'normal'),
+    'symbol': ('symbol', 'category', 'int'),
+}
+
+
+def generate_dataset(rows, cols=20, null_fraction=0.1, seed=42, mix='mixed'):
+    """
+    Builds a synthetic pandas DataFrame with fully vectorised NumPy calls.
+
+    Parameters
+    ----------
+    rows : int
+        Number of rows.
+    cols : int, default 20
+        Number of columns, named col_0 .. col_{cols-1}.
+    null_fraction : float, default 0.1
+        Fraction of nulls injected into every column.
+    seed : int, default 42
+        Random seed.
+    mix : str, default 'mixed'
+        Column mix, one of MIXES. 'mixed' cycles int, uniform float, 5-letter
+        strings from a pool of 100, 'A'-'D' categories and normal floats.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Generated data.
+    """
+    rng = np.random.default_rng(seed)
+    kinds = MIXES[mix]
+    pool = np.array([''.join(w) for w in rng.choice(_LETTERS, (100, 5))], dtype=object)
+    categories = np.array(['A', 'B', 'C', 'D'], dtype=object)
+
+    data = {}
+    for i in range(cols):
+        kind = kinds[i % len(kinds)]
+        if kind == 'int':
+            values = rng.integers(1, 1000, rows).astype(np.float64 if null_fraction > 0 else np.int64)
+        elif kind == 'float':
+            values = rng.uniform(0, 100, rows)
+        elif kind == 'symbol':
+            values = pool[rng.integers(0, len(pool), rows)]
+        elif kind == 'category':
+            values = categories[rng.integers(0, len(categories), rows)]
+        else:
+            values = rng.standard_normal(rows)
+
+        if null_fraction > 0:
+            mask = rng.random(rows) < null_fraction
+            values[mask] = None if values.dtype == object else np.nan
+        data[f'col_{i}'] = values
+    return pd.DataFrame(data)
+
+
+def _cases(tmpdir):
+    """
+    Returns {name: callable(q_table)} covering every public function.
+    """
+    csv_path = os.path.join(tmpdir, 'bench.csv')
+
+    def from_csv(t):
+        if not os.path.exists(csv_path):
+            qpd.to_csv(t, csv_path)
+        return qpd.from_csv(csv_path)
+
+    parquet_path = os.path.join(tmpdir, 'bench.parquet')
+
+    def from_parquet(t):
+        if not os.path.exists(parquet_path):
+            qpd.to_parquet(t, parquet_path)
+        return qpd.from_parquet(parquet_path)
+
+    ipc_path = os.path.join(tmpdir, 'bench.arrow')
+
+    def from_arrow_ipc(t):
+        if not os.path.exists(ipc_path):
+            qpd.to_arrow_ipc(t, ipc_path)
+        return qpd.from_arrow_ipc(ipc_path)
+
+    kdb_root = os.path.join(tmpdir, 'bench_kdb')
+
+    def from_kdb(t):
+        if not os.path.exists(kdb_root):
+            qpd.to_kdb(t, os.path.join(kdb_root, 'bench'))
+        return qpd.from_kdb(os.path.join(kdb_root, 'bench'))
+
+    # to_partitioned needs an int partition column; it is added once per
+    # input table so the cases time only the write and the read.
+    parted = {}
+
+    def with_part(t):
+        if parted.get('source') is not t:
+            import pykx as kx
+            parted.update(source=t, table=kx.q("{update part:i mod 16 from x}", t))
+        return parted['table']
+
+    db_root = os.path.join(tmpdir, 'bench_db')
+
+    def from_partitioned(t):
+        if not os.path.exists(db_root):
+            qpd.to_partitioned(with_part(t), db_root, 'bench', partition_col='part')
+        return qpd.loc(qpd.from_partitioned(db_root, 'bench'))
+
+    def merge(t):
+        lookup = qpd.groupby_avg(t, 'col_3', 'col_1')
+        return qpd.merge(t, lookup, on='col_3', how='left')
+
+    return {
+        'DataFrame': lambda t: qpd.DataFrame(t),
+        'dropna': lambda t: qpd.dropna(t),
+        'dropna_col': lambda t: qpd.dropna_col(t, 'col_0'),
+        'fillna': lambda t: qpd.fillna(t, 'col_0', 0),
+        'remove_duplicates': lambda t: qpd.remove_duplicates(t),
+        'duplicated': lambda t: qpd.duplicated(t, subset=['col_2', 'col_3']),
+        'interpolate': lambda t: qpd.interpolate(t, ['col_0', 'col_1']),
+        'cast': lambda t: qpd.cast(t, 'col_0', 'float32'),
+        'drop_col': lambda t: qpd.drop_col(t, 'col_1'),
+        'rename': lambda t: qpd.rename(t, {'col_0': 'renamed'}),
+        'merge': merge,
+        'groupby_sum': lambda t: qpd.groupby_sum(t, 'col_3', 'col_0'),
+        'groupby_avg': lambda t: qpd.groupby_avg(t, 'col_3', 'col_1'),
+        'groupby_chunked': lambda t: qpd.groupby_chunked(t, 'col_3', ['col_0', 'col_1'], aggs=['sum', 'mean'],
+                                                         chunksize=max(len(t) // 4, 1)),
+        'to_csv': lambda t: qpd.to_csv(t, os.path.join(tmpdir, 'out.csv')),
+        'from_csv': from_csv,
+        'to_parquet': lambda t: qpd.to_parquet(t, os.path.join(tmpdir, 'out.parquet')),
+        'from_parquet': from_parquet,
+        'to_arrow_ipc': lambda t: qpd.to_arrow_ipc(t, os.path.join(tmpdir, 'out.arrow')),
+        'from_arrow_ipc': from_arrow_ipc,
+        'to_kdb': lambda t: qpd.to_kdb(t, os.path.join(tmpdir, 'out_kdb', 'bench')),
+        'from_kdb': from_kdb,
+        'to_partitioned': lambda t: qpd.to_partitioned(with_part(t), os.path.join(tmpdir, 'out_db'), 'bench',
+                                                       partition_col='part'),
+        'from_partitioned': from_partitioned,
+        'apply': lambda t: qpd.apply(t, 'count', axis=0),
+        'apply_col': lambda t: qpd.apply_col(t, 'col_0', '{x+1}'),
+        'dtypes': lambda t: qpd.dtypes(t),
+        'memory_usage': lambda t: qpd.memory_usage(t, deep=True),
+        'loc': lambda t: qpd.loc(t, cols=['col_0', 'col_1']),
+        'iloc': lambda t: qpd.iloc(t, rows=slice(0, len(t) // 2)),
+        'lazy': lambda t: qpd.lazy(t).dropna_col('col_0').fillna('col_1', 0).groupby_sum('col_3', 'col_1').collect(),
+    }
+
+
+def _time(func, repeat):
+    try:
+        func()
+    except Exception as e:
+        return {'error': str(e)}
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'mean_s': float(np.mean(times)), 'min_s': float(np.min(times))}
+
+
+def run(rows=(1_000, 10_000, 100_000, 1_000_000), mixes=('mixed',), functions=None,
+        cols=20, repeat=3, threads=(None,), verbose=True):
+    """
+    Runs the benchmark matrix.
+
+    Parameters
+    ----------
+    rows : sequence of int
+        Row counts to benchmark.
+    mixes : sequence of str
+        Column mixes from MIXES.
+    functions : sequence of str, optional
+        Subset of function names; all public functions by default.
+    cols : int, default 20
+        Column count of the generated tables.
+    repeat : int, default 3
+        Timed iterations per case, after one warm-up call.
+    threads : sequence of int or None, default (None,)
+        Secondary thread counts to run each case with (see set_threads);
+        None leaves the current setting.
+    verbose : bool, default True
+        Print each result as it completes.
+
+    Returns
+    -------
+    dict
+        {'meta': ..., 'results': [...], 'scaling': {...}}.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cases = _cases(tmpdir)
+        names = list(functions) if functions else list(cases)
+        unknown = set(names) - set(cases)
+        if unknown:
+            raise ValueError(f"Unknown benchmark functions: {sorted(unknown)}")
+
+        for mix in mixes:
+            for n in rows:
+                q_table = qpd.DataFrame(generate_dataset(int(n), cols=cols, mix=mix))
+                for cached in ('bench.csv', 'bench.parquet', 'bench.arrow'):
+                    cached = os.path.join(tmpdir, cached)
+                    if os.path.exists(cached):
+                        os.remove(cached)
+                for cached in ('bench_kdb', 'bench_db', 'out_kdb', 'out_db'):
+                    shutil.rmtree(os.path.join(tmpdir, cached), ignore_errors=True)
+                for t in threads:
+                    if t is not None:
+                        qpd.set_threads(t)
+                    for name in names:
+                        res = {'function': name, 'rows': int(n), 'mix': mix, 'threads': t,
+                               **_time(lambda: cases[name](q_table), repeat)}
+                        results.append(res)
+                        if verbose:
+                            timing = res.get('error') or f"{res['mean_s']:.6f} s"
+                            label = '' if t is None else f" s={t}"
+                            print(f"{mix:>8} {int(n):>12,} {name:<18} {timing}{label}")
+                del q_table
+                gc.collect()
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'qutePandas': qpd.__version__,
+            'cols': cols,
+            'repeat': repeat,
+        },
+        'results': results,
+        'scaling': _scaling(results),
+    }
+
+
+def _scaling(results):
+    """
+    Fits time ~ rows^k per (function, mix); k near 1 means linear scaling.
+    """
+    groups = {}
+    for r in results:
+        if 'mean_s' in r and r['mean_s'] > 0:
+            key = f"{r['function']}/{r['mix']}"
+            if r.get('threads') is not None:
+                key += f"/s={r['threads']}"
+            groups.setdefault(key, []).append((r['rows'], r['mean_s']))
+    scaling = {}
+    for key, points in groups.items():
+        if len(points) >= 2:
+            x, y = np.log10(np.array(points, dtype=float)).T
+            scaling[key] = round(float(np.polyfit(x, y, 1)[0]), 3)
+    return scaling
+
+
+def compare(current, baseline, threshold=0.2):
+    """
+    Returns the cases whose mean time grew by more than threshold.
+
+    Parameters
+    ----------
+    current, baseline : dict
+        Outputs of run() (or their JSON).
+    threshold : float, default 0.2
+        Allowed relative slowdown, 0.2 meaning 20%.
+
+    Returns
+    -------
+    list of dict
+        One entry per regressed case with the baseline, current and ratio.
+    """
+    def key(r):
+        return (r['function'], r['rows'], r['mix'], r.get('threads'))
+
+    base = {key(r): r for r in baseline['results'] if 'mean_s' in r}
+    regressions = []
+    for r in current['results']:
+        b = base.get(key(r))
+        if b is None or 'mean_s' not in r or b['mean_s'] <= 0:
+            continue
+        ratio = r['mean_s'] / b['mean_s']
+        if ratio > 1 + threshold:
+            regressions.append({'function': r['function'], 'rows': r['rows'], 'mix': r['mix'], 'threads': r.get('threads'),
+                                'baseline_s': b['mean_s'], 'current_s': r['mean_s'],
+                                'ratio': round(ratio, 3)})
+    return regressions
+
+
+def _parse_rows(text):
+    return [int(float(v)) for v in text.split(',') if v]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m qutePandas.bench', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=_parse_rows, default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="comma-separated row counts, e.g. 1e3,1e5,1e8")
+    parser.add_argument('--mix', default='mixed', help=f"comma-separated column mixes: {','.join(MIXES)}")
+    parser.add_argument('--functions', default=None, help="comma-separated subset of functions")
+    parser.add_argument('--cols', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threads', type=_parse_rows, default=[None],
+                        help="comma-separated secondary thread counts, e.g. 0,4,16 (needs QUTEPANDAS_THREADS)")
+    parser.add_argument('--output', help="write results JSON to this path")
+    parser.add_argument('--baseline', help="compare against a previous results JSON")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed relative slowdown (default 0.2)")
+    args = parser.parse_args(argv)
+
+    qpd.connect()
+    report = run(rows=args.rows, mixes=args.mix.split(','),
+                 functions=args.functions.split(',') if args.functions else None,
+                 cols=args.cols, repeat=args.repeat, threads=args.threads)
+
+    print("\nScaling exponents (time ~ rows^k):")
+    for key, k in sorted(report['scaling'].items()):
+        print(f"  {key:<28} {k}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"  {r['function']:<18} {r['mix']:>8} {r['rows']:>12,}  "
+                      f"{r['baseline_s']:.6f}s -> {r['current_s']:.6f}s (x{r['ratio']})")
+            return 1
+        print(f"\nNo regressions above {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,5 +2,7 @@ from .dropna import dropna
 from .dropna_col import dropna_col
 from .fillna import fillna
 from .remove_duplicates import remove_duplicates
+from .duplicated import duplicated
+from .interpolate import interpolate
 
-__all__ = ['dropna', 'dropna_col', 'fillna', 'remove_duplicates']
\ No newline at end of file
+__all__ = ['dropna', 'dropna_col', 'fillna', 'remove_duplicates', 'duplicated', 'interpolate']
\ No newline at end of file
@@ -1,17 +1,32 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
 
-def dropna(df, return_type='q'):
+@_instrument
+def dropna(df, return_type='q', subset=None, how='any', thresh=None):
     """
-    Drops any row containing null values.
+    Drops rows containing null values.
+
+    The test compiles to a single functional select whose where clause
+    covers only the requested columns. With how='any' each column is a
+    separate constraint, so later columns are only checked on rows that
+    survived the earlier ones. Boolean and byte columns, which cannot hold
+    nulls in kdb+, are never scanned.
 
     Parameters
     ----------
     df : pandas.DataFrame or pykx.Table
         Input DataFrame.
     return_type : str, default 'q'
-        Desired return type ('p' for pandas, 'q' for kdb+).
+        Desired return type ('p' for pandas, 'q' for kdb+, 'a' for pyarrow, 'n' for NumPy,
+        'l' for a lazily converted pandas view).
+    subset : str or list of str, optional
+        Columns to check for nulls. Defaults to all columns.
+    how : {'any', 'all'}, default 'any'
+        Drop a row if any, or only if all, of the checked columns are null.
+    thresh : int, optional
+        Keep only rows with at least this many non-null values among the
+        checked columns. Takes the place of how.
 
     Returns
     -------
@@ -19,8 +34,20 @@ def dropna(df, return_type='q'):
         DataFrame with null rows removed.
     """
     try:
+        if how not in ('any', 'all'):
+            raise ValueError(f"how must be 'any' or 'all', got {how!r}")
+        if thresh is not None and how != 'any':
+            raise ValueError("Cannot set both how and thresh")
+
         q_table = _ensure_q_table(df)
-        result = kx.q("{select from x where not any null each value flip x}", q_table)
+        if subset is None:
+            subset = _q_func('data_cols')(q_table).py()
+        elif isinstance(subset, str):
+            subset = [subset]
+        _validate_columns(q_table, subset)
+
+        q_thresh = kx.LongAtom.null if thresh is None else kx.LongAtom(thresh)
+        result = _q_func('drop_nulls')(q_table, kx.SymbolVector(subset), kx.SymbolAtom(how), q_thresh)
         return _handle_return(result, return_type)
     except Exception as e:
-        raise RuntimeError(f"Failed to dropna: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to dropna: {e}")
@@ -1,7 +1,8 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _instrument
 
+@_instrument
 def dropna_col(df, col, return_type='q'):
     """
     Drops rows where a specific column is null.
@@ -13,7 +14,8 @@ def dropna_col(df, col, return_type='q'):
     col : str
         Column name to check for nulls.
     return_type : str, default 'q'
-        Desired return type ('p' for pandas, 'q' for kdb+).
+        Desired return type ('p' for pandas, 'q' for kdb+, 'a' for pyarrow, 'n' for NumPy,
+        'l' for a lazily converted pandas view).
 
     Returns
     -------
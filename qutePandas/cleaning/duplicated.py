@@ -0,0 +1,52 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
+
+_KEEP = {'first': 'first', 'last': 'last', False: 'none'}
+
+
+def _duplicate_mask(q_table, subset, keep):
+    """
+    Boolean vector marking duplicate rows, comparing only the subset columns.
+    """
+    if keep not in _KEEP:
+        raise ValueError(f"keep must be 'first', 'last' or False, got {keep!r}")
+    if subset is None:
+        subset = _q_func('data_cols')(q_table).py()
+    elif isinstance(subset, str):
+        subset = [subset]
+    _validate_columns(q_table, subset)
+    return _q_func('dup_mask')(q_table, kx.SymbolVector(subset), kx.SymbolAtom(_KEEP[keep]))
+
+
+@_instrument
+def duplicated(df, subset=None, keep='first', return_type='q'):
+    """
+    Marks duplicate rows.
+
+    Only the subset columns are read: a single key column is searched
+    directly and several are viewed as a table of just those columns, so
+    the remaining columns are never hashed.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame.
+    subset : str or list of str, optional
+        Columns identifying duplicates. Defaults to all columns.
+    keep : {'first', 'last', False}, default 'first'
+        Occurrence not marked as a duplicate: the first, the last, or none
+        (every row of a repeated key is marked).
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pandas.Series or pykx.BooleanVector
+        True for each row that is a duplicate.
+    """
+    try:
+        q_table = _ensure_q_table(df)
+        return _handle_return(_duplicate_mask(q_table, subset, keep), return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to find duplicates: {e}")
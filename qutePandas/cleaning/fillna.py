@@ -1,26 +1,46 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
 
-def fillna(df, col_or_values, fill_value=None, return_type='q'):
+_METHODS = ('ffill', 'bfill')
+
+
+@_instrument
+def fillna(df, col_or_values=None, fill_value=None, return_type='q', method=None, by=None, limit=None):
     """
     Fills null values in specified columns.
 
-    Can be called in two ways:
+    Can be called in three ways:
         fillna(df, values_dict, return_type='q')
         fillna(df, col_name, fill_value, return_type='q')
+        fillna(df, cols, method='ffill', by=None, limit=None, return_type='q')
+
+    All columns are filled by one functional update, so the table is
+    rebuilt once however many columns are filled.
 
     Parameters
     ----------
     df : pandas.DataFrame or pykx.Table
         Input DataFrame.
-    col_or_values : str or dict
+    col_or_values : str, dict or list of str
         If str, the column name to fill (requires fill_value).
         If dict, a mapping of column names to fill values.
+        With method, the column name(s) to fill; defaults to every column
+        not in by.
     fill_value : scalar, optional
         The value to fill nulls with when col_or_values is a column name.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+    method : {'ffill', 'bfill'}, optional
+        Propagate the last (ffill) or next (bfill) non-null value instead
+        of filling with a constant, using q's ``fills``.
+    by : str or list of str, optional
+        With method, fill within groups of these key columns (e.g. per
+        symbol), so values never leak from one group into another. Row
+        order is preserved.
+    limit : int, optional
+        With method, fill at most this many consecutive nulls after (or
+        before, for bfill) each non-null value.
 
     Returns
     -------
@@ -28,6 +48,29 @@ def fillna(df, col_or_values, fill_value=None, return_type='q'):
         DataFrame with nulls filled.
     """
     try:
+        q_table = _ensure_q_table(df)
+
+        if method is not None:
+            if method not in _METHODS:
+                raise ValueError(f"method must be 'ffill' or 'bfill', got {method!r}")
+            if fill_value is not None or isinstance(col_or_values, dict):
+                raise ValueError("Cannot specify both a fill value and a method")
+            if limit is not None and limit <= 0:
+                raise ValueError("limit must be positive")
+            by = [by] if isinstance(by, str) else list(by or [])
+            if col_or_values is None:
+                cols = [c for c in kx.q("cols", q_table).py() if c not in by]
+            else:
+                cols = [col_or_values] if isinstance(col_or_values, str) else list(col_or_values)
+            _validate_columns(q_table, cols + by)
+
+            q_limit = kx.LongAtom.null if limit is None else kx.LongAtom(limit)
+            result = _q_func('fill_dir')(q_table, kx.SymbolVector(cols), kx.SymbolVector(by),
+                                         kx.SymbolAtom(method), q_limit)
+            return _handle_return(result, return_type)
+
+        if by is not None or limit is not None:
+            raise ValueError("by and limit require method='ffill' or 'bfill'")
         if isinstance(col_or_values, str):
             if fill_value is None:
                 raise ValueError("fill_value is required when col_or_values is a column name")
@@ -37,13 +80,12 @@ def fillna(df, col_or_values, fill_value=None, return_type='q'):
         else:
             raise ValueError("col_or_values must be a column name (str) or a dictionary")
 
-        q_table = _ensure_q_table(df)
-        result = q_table
-
-        for col, val in values.items():
-            fill_val = f'`{val}' if isinstance(val, str) else str(val)
-            result = kx.q(f"{{update {col}:{fill_val}^{col} from x}}", result)
+        if not values:
+            return _handle_return(q_table, return_type)
+        _validate_columns(q_table, list(values))
+        fill_vals = [kx.SymbolAtom(v) if isinstance(v, str) else kx.toq(v) for v in values.values()]
+        result = _q_func('fill')(q_table, kx.SymbolVector(list(values)), kx.toq(fill_vals))
 
         return _handle_return(result, return_type)
     except Exception as e:
-        raise RuntimeError(f"Failed to fillna: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to fillna: {e}")
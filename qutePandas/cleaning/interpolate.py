@@ -0,0 +1,71 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
+
+_METHODS = ('linear', 'time', 'nearest')
+
+# Integer, float and temporal column types (datetime is interpolated as float).
+_NUMERIC_TYPES = {5, 6, 7, 8, 9, 12, 13, 14, 15, 16, 17, 18, 19}
+
+
+@_instrument
+def interpolate(df, cols, method='linear', by=None, on=None, return_type='q'):
+    """
+    Fills interior gaps by interpolating between the surrounding values.
+
+    Each column is filled in one vector pass: the previous and next
+    non-null positions of every row are found with ``fills`` over row
+    indices, and the gap values are computed from them at once, so no
+    per-gap loop or pandas round-trip is involved. Leading nulls are left
+    null; trailing nulls take the last valid value, as in pandas.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame.
+    cols : str or list of str
+        Integer, float or temporal columns to interpolate. Integer columns
+        become floats for 'linear' and 'time'; temporal columns keep their
+        type, rounded to their unit.
+    method : {'linear', 'time', 'nearest'}, default 'linear'
+        'linear' treats rows as equally spaced; 'time' weights by the
+        values of the on column; 'nearest' takes the closer neighbour by
+        row position, or by the on column when given, the earlier one on a
+        tie.
+    by : str or list of str, optional
+        Interpolate within groups of these key columns (e.g. per symbol),
+        never across them. Row order is preserved.
+    on : str, optional
+        Time (or numeric) column giving the x positions, required for
+        'time'. Rows are assumed sorted by it within each group.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pandas.DataFrame or pykx.Table
+        DataFrame with gaps interpolated.
+    """
+    try:
+        if method not in _METHODS:
+            raise ValueError(f"method must be one of {list(_METHODS)}, got {method!r}")
+        if method == 'time' and on is None:
+            raise ValueError("method='time' requires the time column as on=")
+        if method == 'linear' and on is not None:
+            raise ValueError("on is only used by method='time' or 'nearest'")
+
+        q_table = _ensure_q_table(df)
+        cols = [cols] if isinstance(cols, str) else list(cols)
+        by = [by] if isinstance(by, str) else list(by or [])
+        _validate_columns(q_table, cols + by + ([on] if on else []))
+
+        col_type = _q_func('col_type')
+        for col in cols + ([on] if on else []):
+            if col_type(q_table, kx.SymbolAtom(col)).py() not in _NUMERIC_TYPES:
+                raise ValueError(f"Column '{col}' is not numeric or temporal")
+
+        result = _q_func('interp')(q_table, kx.SymbolVector(cols), kx.SymbolVector(by),
+                                   kx.SymbolAtom(method), kx.SymbolAtom(on or ''))
+        return _handle_return(result, return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to interpolate: {e}")
@@ -1,18 +1,30 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
+from .duplicated import _duplicate_mask
 
 
-def remove_duplicates(df, return_type='q'):
+@_instrument
+def remove_duplicates(df, return_type='q', subset=None, keep='first'):
     """
-    Removes duplicate rows from the DataFrame, keeping the first occurrence.
+    Removes duplicate rows from the DataFrame.
+
+    Duplicates are found on the subset columns only (see duplicated) and
+    the surviving rows are selected by index, so deduplicating a wide
+    table on a narrow key does not touch the other columns until the
+    final selection.
 
     Parameters
     ----------
     df : pandas.DataFrame or pykx.Table
         Input DataFrame.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+    subset : str or list of str, optional
+        Columns identifying duplicates. Defaults to all columns.
+    keep : {'first', 'last', False}, default 'first'
+        Occurrence to keep: the first, the last, or none (drop every row
+        whose key is repeated).
 
     Returns
     -------
@@ -21,8 +33,8 @@ def remove_duplicates(df, return_type='q'):
     """
     try:
         q_table = _ensure_q_table(df)
-        result = kx.q("{distinct x}", q_table)
+        mask = _duplicate_mask(q_table, subset, keep)
+        result = _q_func('drop_mask')(q_table, mask)
         return _handle_return(result, return_type)
     except Exception as e:
         raise RuntimeError(f"Failed to remove duplicates from table: {e}")
- 
\ No newline at end of file
@@ -4,6 +4,16 @@ Core functionality for qutePandas - DataFrame creation and basic operations.
 
 from .dataframe import DataFrame
 from .display import py, np, pd, pa, pt, print
-from .connection import connect, get_license_info
+from .connection import connect, get_license_info, set_threads
+from .lazy import LazyFrame, lazy
+from .proxy import LazyDataFrame
+from .remote import RemoteSession
+from .partitioned import PartitionedTable
+from .profiling import profile, Profiler, add_hook, remove_hook
+from .memory import heap_stats, gc, set_gc_policy
+from .cache import enable_conversion_cache, disable_conversion_cache, clear_conversion_cache, conversion_cache_info
 
-__all__ = ['DataFrame', 'py', 'np', 'pd', 'pa', 'pt', 'print', 'connect', 'get_license_info'] 
\ No newline at end of file
+__all__ = ['DataFrame', 'py', 'np', 'pd', 'pa', 'pt', 'print', 'connect', 'get_license_info', 'set_threads', 'LazyFrame', 'lazy', 'LazyDataFrame', 'RemoteSession', 'PartitionedTable',
+           'profile', 'Profiler', 'add_hook', 'remove_hook',
+           'heap_stats', 'gc', 'set_gc_policy',
+           'enable_conversion_cache', 'disable_conversion_cache', 'clear_conversion_cache', 'conversion_cache_info'] 
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Opt-in cache for pandas -> kdb+ conversions performed by qutePandas functions.
+"""
+
+from .. import utils
+
+
+def enable_conversion_cache(max_bytes=256 * 1024 ** 2, max_entries=64):
+    """
+    Enables reuse of converted q tables for repeated pandas inputs.
+
+    While enabled, every function that accepts a pandas DataFrame looks the
+    frame up by identity and fingerprint before calling ``kx.toq``, so running
+    several operations on the same frame converts it only once. Entries are
+    dropped when the frame is garbage collected, when its shape, labels,
+    dtypes, column buffers or sampled rows change, or when the budget is exceeded (least
+    recently used first).
+
+    Parameters
+    ----------
+    max_bytes : int, default 256 MiB
+        Memory budget, measured as the deep pandas memory usage of cached
+        frames, so object and string columns are charged for their values.
+        Frames larger than the budget are converted but never cached.
+    max_entries : int, default 64
+        Maximum number of cached conversions.
+
+    Returns
+    -------
+    dict
+        Cache statistics after enabling.
+    """
+    if max_bytes <= 0 or max_entries <= 0:
+        raise ValueError("max_bytes and max_entries must be positive")
+
+    if utils._conversion_cache is None:
+        utils._conversion_cache = utils._ConversionCache(max_bytes, max_entries)
+    else:
+        utils._conversion_cache.max_bytes = max_bytes
+        utils._conversion_cache.max_entries = max_entries
+    return utils._conversion_cache.info()
+
+
+def disable_conversion_cache():
+    """
+    Disables the conversion cache and releases every cached table.
+    """
+    if utils._conversion_cache is not None:
+        utils._conversion_cache.clear()
+        utils._conversion_cache = None
+
+
+def clear_conversion_cache():
+    """
+    Releases every cached table, keeping the cache enabled.
+
+    Call this after mutating a cached DataFrame in place (for example
+    ``df.loc[5, 'a'] = 99``): the fingerprint checks only column buffers and
+    sampled rows, so edits to other rows are not detected.
+    """
+    if utils._conversion_cache is not None:
+        utils._conversion_cache.clear()
+
+
+def conversion_cache_info():
+    """
+    Returns conversion cache statistics.
+
+    Returns
+    -------
+    dict
+        Keys 'enabled', 'hits', 'misses', 'entries', 'bytes', 'max_bytes' and 'max_entries'.
+    """
+    if utils._conversion_cache is None:
+        return {'enabled': False}
+    return {'enabled': True, **utils._conversion_cache.info()}
@@ -75,14 +75,87 @@ def install_license(content, is_base64=True):
     return True
 
 
-def connect(license_path=None):
+def connect(host=None, port=None, pool_size=1, username='', password='', timeout=0.0, tls=False, license_path=None,
+            threads=None):
     """
     Establishes connection to kdb+.
 
+    Without a port, validates the license for embedded q and returns True.
+    With a port, returns a RemoteSession whose operations run on the server.
+
     Parameters
     ----------
+    host : str, optional
+        Server host for a remote session, default 'localhost'. For backwards
+        compatibility a single positional argument without port is treated
+        as license_path.
+    port : int, optional
+        Server port. Giving a port selects remote mode.
+    pool_size : int, default 1
+        Maximum number of pooled IPC connections in remote mode.
+    username, password : str, optional
+        Server credentials.
+    timeout : float, default 0.0
+        IPC timeout in seconds, 0 meaning none.
+    tls : bool, default False
+        Use a TLS connection.
     license_path : str, optional
         Path to the license file or directory.
+    threads : int, optional
+        Number of q secondary threads for embedded q, used by peach in
+        column-wise and grouped operations. q fixes the maximum at startup,
+        so set QUTEPANDAS_THREADS=N (or QARGS='-s N') before importing
+        qutePandas; threads can then lower or restore the count.
+
+    Returns
+    -------
+    bool or RemoteSession
+        True for embedded q, otherwise the remote session.
+    """
+    if port is not None:
+        from .remote import RemoteSession
+        return RemoteSession(host or 'localhost', port, pool_size=pool_size, username=username,
+                             password=password, timeout=timeout, tls=tls)
+
+    if host is not None and license_path is None:
+        license_path = host
+
+    _connect_embedded(license_path)
+    if threads is not None:
+        set_threads(threads)
+    return True
+
+
+def set_threads(threads):
+    """
+    Sets the number of q secondary threads used by peach.
+
+    Parameters
+    ----------
+    threads : int
+        Secondary thread count, at most the -s value q was started with.
+
+    Returns
+    -------
+    int
+        The active secondary thread count.
+    """
+    from ..utils import _q_func
+    if threads < 0:
+        raise ValueError("threads must be non-negative")
+    try:
+        _q_func('set_threads')(kx.IntAtom(threads))
+        return kx.q('system"s"').py()
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to use {threads} secondary threads: {e}. q allows at most the thread count "
+            f"it was started with; set QUTEPANDAS_THREADS={threads} before importing qutePandas."
+        )
+
+
+def _connect_embedded(license_path):
+    """
+    Validates the embedded q license, searching the standard locations.
     """
     if license_path:
         if not os.path.exists(license_path):
@@ -1,8 +1,9 @@
 import pykx as kx
 import pandas as pd
 import atexit
-from ..utils import _handle_return
+from ..utils import _handle_return, _instrument
 
+@_instrument
 def DataFrame(data, columns=None):
     """
     Creates a qutePandas DataFrame (internal pykx Table).
@@ -0,0 +1,378 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
+from ..transformation.cast import _Q_TYPE_MAP, _TYPE_CODES
+
+
+def _expand(template, x, y=None):
+    """
+    Builds an expression node from a template with `x`/`y` placeholders.
+
+    Nodes are plain q lists built without evaluating q; the ``lazy_run``
+    lambda parses the templates where the pipeline runs, so remote
+    pipelines compile on the server.
+    """
+    return kx.toq([kx.CharVector(template), x, kx.toq(None) if y is None else y])
+
+
+def _constant(value):
+    """
+    Wraps a Python scalar so it evaluates to itself inside a parse tree.
+    """
+    if isinstance(value, str):
+        return kx.SymbolVector([value])
+    return kx.toq(value)
+
+
+# Row filter matching eager dropna (drop_nulls): string columns (general
+# lists of char vectors) are null only when every character is, and boolean
+# and byte columns, which cannot hold nulls, are not scanned. The column type
+# is checked where the pipeline runs, once per column.
+_NOT_NULL = "$[(type x) in 1 4h; (count x)#1b; 0h=type x; not all each null x; not null x]"
+
+
+class LazyFrame:
+    """
+    Deferred qutePandas pipeline compiled into functional q queries.
+
+    Operations are recorded rather than executed. ``collect`` compiles the
+    recorded steps into ``?[t;where;by;cols]`` stages and runs them in a
+    single q call, so filters are evaluated before column expressions and
+    no intermediate tables are materialised on the Python side. A new stage
+    is only started after a grouping step.
+
+    Pipelines created by ``RemoteSession.table`` hold only the column names
+    of a server table; they are compiled and run on the server by
+    ``collect``, so no local q is needed.
+    """
+
+    def __init__(self, table, stages=None, source=None):
+        self._table = table
+        self._source = source
+        if stages is None:
+            stages = [self._new_stage(kx.q("cols", table).py())]
+        self._stages = stages
+
+    @staticmethod
+    def _new_stage(cols):
+        return {'where': [], 'by': None, 'exprs': {c: kx.SymbolAtom(c) for c in cols}}
+
+    def _copy(self):
+        stages = [
+            {'where': list(s['where']), 'by': s['by'], 'exprs': dict(s['exprs'])}
+            for s in self._stages
+        ]
+        return LazyFrame(self._table, stages, self._source)
+
+    def _open(self):
+        """
+        Returns the stage new steps are added to, starting one after a grouping.
+        """
+        if self._stages[-1]['by'] is not None:
+            self._stages.append(self._new_stage(self.columns))
+        return self._stages[-1]
+
+    @property
+    def columns(self):
+        """
+        Column names of the pipeline result.
+        """
+        stage = self._stages[-1]
+        return list(stage['by'] or {}) + list(stage['exprs'])
+
+    def _validate(self, cols):
+        existing = self.columns
+        for col in cols:
+            if col not in existing:
+                raise ValueError(f"Column '{col}' not found in table.")
+
+    @staticmethod
+    def _compile_stage(stage):
+        q_by = kx.toq(False) if stage['by'] is None else kx.toq(stage['by'])
+        return [kx.toq(stage['where']), q_by, kx.toq(stage['exprs'])]
+
+    def dropna(self):
+        """
+        Drops any row containing null values.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline with the null filter appended.
+        """
+        res = self._copy()
+        stage = res._open()
+        for tree in stage['exprs'].values():
+            stage['where'].append(_expand(_NOT_NULL, tree))
+        return res
+
+    def dropna_col(self, col):
+        """
+        Drops rows where a specific column is null.
+
+        Parameters
+        ----------
+        col : str
+            Column name to check for nulls.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline with the null filter appended.
+        """
+        self._validate([col])
+        res = self._copy()
+        stage = res._open()
+        stage['where'].append(_expand(_NOT_NULL, stage['exprs'][col]))
+        return res
+
+    def fillna(self, col_or_values, fill_value=None):
+        """
+        Fills null values in specified columns.
+
+        Parameters
+        ----------
+        col_or_values : str or dict
+            Column name (requires fill_value) or mapping of column names to fill values.
+        fill_value : scalar, optional
+            The value to fill nulls with when col_or_values is a column name.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline with the fill expressions applied.
+        """
+        if isinstance(col_or_values, str):
+            if fill_value is None:
+                raise ValueError("fill_value is required when col_or_values is a column name")
+            values = {col_or_values: fill_value}
+        elif isinstance(col_or_values, dict):
+            values = col_or_values
+        else:
+            raise ValueError("col_or_values must be a column name (str) or a dictionary")
+
+        self._validate(list(values))
+        res = self._copy()
+        exprs = res._open()['exprs']
+        for col, val in values.items():
+            exprs[col] = _expand("y^x", exprs[col], _constant(val))
+        return res
+
+    def cast(self, col, dtype):
+        """
+        Converts column to specified data type.
+
+        Parameters
+        ----------
+        col : str
+            Column name to cast.
+        dtype : str
+            Target data type ('i' for int, 'f' for float, 's' for symbol, etc.).
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline with the cast expression applied.
+        """
+        q_type = _Q_TYPE_MAP.get(dtype, dtype)
+        if len(q_type) != 1:
+            raise ValueError(f"Unsupported q cast type: {dtype}")
+        self._validate([col])
+
+        res = self._copy()
+        exprs = res._open()['exprs']
+        # The column type is only known where the pipeline runs, so the
+        # choice between no-op, parse and cast is made there by $[...].
+        q_char = q_type.lower()
+        target_code = _TYPE_CODES.get(q_char)
+        same = f"{target_code}=abs type x; x; " if target_code is not None else ""
+
+        if q_char == 's':
+            template = f"$[{same}`$string x]"
+        elif q_char in ('i', 'j'):
+            template = f"$[{same}(type x) in 0 10h; (upper y)$x; y$((x>=0)*floor x + (x<0)*ceiling x)]"
+        else:
+            template = f"$[{same}(type x) in 0 10h; (upper y)$x; y$x]"
+        exprs[col] = _expand(template, exprs[col], kx.CharAtom(q_char))
+        return res
+
+    def drop_col(self, cols):
+        """
+        Removes specified column(s) from the pipeline result.
+
+        Parameters
+        ----------
+        cols : list of str or str
+            Column names to drop.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline without the dropped columns.
+        """
+        if isinstance(cols, str):
+            cols = [cols]
+        if not isinstance(cols, (list, tuple)):
+            raise ValueError("cols must be a list of column names")
+        self._validate(cols)
+        if len(set(cols)) == len(self.columns):
+            raise ValueError("Cannot drop every column from a lazy pipeline")
+
+        res = self._copy()
+        exprs = res._open()['exprs']
+        for col in cols:
+            exprs.pop(col)
+        return res
+
+    def rename(self, columns):
+        """
+        Renames columns in the pipeline result.
+
+        Parameters
+        ----------
+        columns : dict
+            Dictionary mapping old column names to new column names.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline with renamed columns.
+        """
+        res = self._copy()
+        stage = res._open()
+        stage['exprs'] = {columns.get(c, c): tree for c, tree in stage['exprs'].items()}
+        return res
+
+    def loc(self, rows=None, cols=None):
+        """
+        Label-location based selection by boolean mask and/or column names.
+
+        Parameters
+        ----------
+        rows : list of bool, pykx.BooleanVector, or None
+            Boolean mask over the rows remaining at this point of the pipeline.
+        cols : str, list of str, or None
+            Column names to select.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline with the selection applied.
+        """
+        if cols is not None:
+            if isinstance(cols, str):
+                cols = [cols]
+            self._validate(cols)
+
+        res = self._copy()
+        stage = res._open()
+        if rows is not None:
+            stage['where'].append(kx.toq(rows) if isinstance(rows, list) else rows)
+        if cols is not None:
+            stage['exprs'] = {c: stage['exprs'][c] for c in cols}
+        return res
+
+    def _groupby(self, by_cols, agg_col, agg):
+        if isinstance(by_cols, str):
+            by_cols = [by_cols]
+        self._validate(by_cols + [agg_col])
+
+        res = self._copy()
+        stage = res._open()
+        exprs = stage['exprs']
+        stage['by'] = {c: exprs[c] for c in by_cols}
+        stage['exprs'] = {agg_col: _expand(f"{agg} x", exprs[agg_col])}
+        return res
+
+    def groupby_sum(self, by_cols, sum_col):
+        """
+        Groups by specified column(s) and sums target column.
+
+        Parameters
+        ----------
+        by_cols : str or list of str
+            Group by column(s).
+        sum_col : str
+            Column to sum.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline over the grouped result.
+        """
+        return self._groupby(by_cols, sum_col, "sum")
+
+    def groupby_avg(self, by_cols, avg_col):
+        """
+        Groups by specified column(s) and averages target column.
+
+        Parameters
+        ----------
+        by_cols : str or list of str
+            Group by column(s).
+        avg_col : str
+            Column to average.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline over the grouped result.
+        """
+        return self._groupby(by_cols, avg_col, "avg")
+
+    @_instrument
+    def collect(self, return_type='q'):
+        """
+        Compiles the recorded steps and executes them in one q call.
+
+        Parameters
+        ----------
+        return_type : str, default 'q'
+            Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+        Returns
+        -------
+        pandas.DataFrame or pykx.Table
+            Result of the whole pipeline.
+        """
+        try:
+            q_stages = kx.toq([self._compile_stage(s) for s in self._stages])
+            if self._source is not None:
+                session, name = self._source
+                result = session._run_stages(name, q_stages)
+            else:
+                result = _q_func('lazy_run')(self._table, q_stages)
+            return _handle_return(result, return_type)
+        except Exception as e:
+            raise RuntimeError(f"Failed to collect lazy query: {e}")
+
+    def __repr__(self):
+        remote = f", remote={self._source[1]!r}" if self._source is not None else ""
+        return f"LazyFrame(columns={self.columns}, stages={len(self._stages)}{remote})"
+
+
+def lazy(df):
+    """
+    Starts a lazy pipeline over a DataFrame.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame.
+
+    Returns
+    -------
+    LazyFrame
+        Pipeline object whose steps run on ``collect()``.
+
+    Examples
+    --------
+    >>> res = qpd.lazy(df).dropna_col('price').fillna('qty', 0).cast('qty', 'f').collect()
+    """
+    try:
+        q_table = _ensure_q_table(df)
+        if isinstance(q_table, kx.KeyedTable):
+            q_table = _q_func('unkey')(q_table)
+        return LazyFrame(q_table)
+    except Exception as e:
+        raise RuntimeError(f"Failed to start lazy pipeline: {e}")
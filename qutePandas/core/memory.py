@@ -0,0 +1,98 @@
+"""
+q heap reporting and garbage-collection policy.
+"""
+
+from .. import utils
+
+_MIB = 1024 ** 2
+
+
+def heap_stats():
+    """
+    Returns the embedded q process memory statistics from ``.Q.w[]``.
+
+    Returns
+    -------
+    dict
+        Bytes for 'used' (live objects), 'heap' (allocated from the OS),
+        'peak', 'wmax' (-w limit, 0 if unset), 'mmap', 'mphy' (physical
+        memory), plus 'syms' and 'symw' for the symbol count and its bytes.
+        'heap' - 'used' is memory q holds but could return with ``gc()``.
+    """
+    import pykx as kx
+    try:
+        return kx.q(".Q.w[]").py()
+    except Exception as e:
+        raise RuntimeError(f"Failed to read q heap statistics: {e}")
+
+
+def gc():
+    """
+    Runs ``.Q.gc[]``, returning unused q heap blocks to the operating system.
+
+    Returns
+    -------
+    int
+        Bytes released.
+    """
+    import pykx as kx
+    try:
+        return kx.q(".Q.gc[]").py()
+    except Exception as e:
+        raise RuntimeError(f"Failed to run q garbage collection: {e}")
+
+
+class _GcPolicy:
+    """
+    Post-call check that runs ``.Q.gc[]`` once the free part of the q heap
+    passes a threshold.
+    """
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.runs = 0
+        self.released = 0
+
+    def __call__(self):
+        stats = heap_stats()
+        if stats['heap'] - stats['used'] >= self.threshold:
+            self.released += gc()
+            self.runs += 1
+
+
+_gc_policy = None
+
+
+def set_gc_policy(threshold=64 * _MIB):
+    """
+    Runs ``.Q.gc[]`` automatically after qutePandas calls.
+
+    Intermediate tables dropped on the Python side go back to q's allocator,
+    not to the OS, so a long-running process keeps its peak footprint. With
+    a policy set, every qutePandas call ends with a single ``.Q.w[]`` heap
+    check, independent of profiling hooks, and calls ``.Q.gc[]`` when the
+    free heap ('heap' - 'used') reaches threshold.
+
+    Parameters
+    ----------
+    threshold : int or None, default 64 MiB
+        Free-heap bytes that trigger a collection. None removes the policy.
+
+    Returns
+    -------
+    dict
+        Current policy: 'threshold', 'runs' and 'released' bytes so far.
+    """
+    global _gc_policy
+    if threshold is not None and threshold < 0:
+        raise ValueError("threshold must be non-negative or None")
+
+    if _gc_policy is not None:
+        utils._post_call_checks.remove(_gc_policy)
+        _gc_policy = None
+    if threshold is None:
+        return {'threshold': None, 'runs': 0, 'released': 0}
+
+    _gc_policy = _GcPolicy(threshold)
+    utils._post_call_checks.append(_gc_policy)
+    return {'threshold': threshold, 'runs': 0, 'released': 0}
@@ -0,0 +1,169 @@
+import os
+import re
+
+import pykx as kx
+import pandas as pd
+from ..utils import _hsym, _q_func
+
+_DATE_DIR = re.compile(r'\d{4}\.\d{2}\.\d{2}')
+
+
+def _list_partitions(db_root, name):
+    """
+    Returns the partition kind ('date' or 'int') and the sorted partition
+    values under db_root that hold the named table.
+    """
+    dates, ints = [], []
+    for entry in os.listdir(db_root):
+        if not os.path.isdir(os.path.join(db_root, entry, name)):
+            continue
+        if _DATE_DIR.fullmatch(entry):
+            dates.append(pd.Timestamp(entry.replace('.', '-')).date())
+            continue
+        try:
+            value = int(entry)
+        except ValueError:
+            continue
+        # Only names q writes for the value ('-3', not '+3', '03' or '0_3').
+        if str(value) == entry:
+            ints.append(value)
+    if dates and ints:
+        raise ValueError(f"{db_root} mixes date and int partitions")
+    if not dates and not ints:
+        raise ValueError(f"No partitions of table '{name}' found in {db_root}")
+    return ('date', sorted(dates)) if dates else ('int', sorted(ints))
+
+
+class PartitionedTable:
+    """
+    Date- or int-partitioned kdb+ table on disk, opened by from_partitioned.
+
+    Opening reads only the directory listing and the column names. ``loc``
+    narrows the table to a set of partitions and columns without reading
+    anything; ``qpd.loc``, ``qpd.groupby_sum`` and ``qpd.groupby_avg`` then
+    memory-map only the selected partitions and page in only the columns
+    they use, so their cost grows with the partitions selected rather than
+    with the whole history.
+    """
+
+    def __init__(self, db_root, name, kind, partition_col, partitions, columns):
+        self.db_root = os.path.abspath(db_root)
+        self.name = name
+        self.kind = kind
+        self.partition_col = partition_col
+        self._partitions = list(partitions)
+        self._columns = list(columns)
+
+    @property
+    def partitions(self):
+        """
+        Selected partition values, in ascending order.
+        """
+        return list(self._partitions)
+
+    @property
+    def columns(self):
+        """
+        Selected column names, including the virtual partition column.
+        """
+        return list(self._columns)
+
+    def _value(self, value):
+        if isinstance(value, bool):
+            raise ValueError(
+                "Rows of a partitioned table are selected by partition value, not by boolean mask"
+            )
+        if self.kind == 'date':
+            return pd.Timestamp(value).date()
+        return int(value)
+
+    def _validate(self, cols):
+        existing = self._columns
+        for col in cols:
+            if col not in existing:
+                raise ValueError(f"Column '{col}' not found in table.")
+
+    def loc(self, rows=None, cols=None):
+        """
+        Selects partitions and columns without reading any data.
+
+        Parameters
+        ----------
+        rows : scalar, list, slice or None
+            Partition value, list of partition values, or slice of partition
+            values with both ends inclusive as in ``pandas.DataFrame.loc``.
+            Dates may be given as ``datetime.date``, timestamps or strings.
+        cols : str, list of str, or None
+            Column names to keep.
+
+        Returns
+        -------
+        PartitionedTable
+            Table restricted to the selection.
+        """
+        partitions = self._partitions
+        if isinstance(rows, slice):
+            if rows.step is not None:
+                raise ValueError("Partition slices do not support a step")
+            lo = None if rows.start is None else self._value(rows.start)
+            hi = None if rows.stop is None else self._value(rows.stop)
+            partitions = [p for p in partitions if (lo is None or p >= lo) and (hi is None or p <= hi)]
+        elif isinstance(rows, (list, tuple, set, kx.K)):
+            values = rows.py() if isinstance(rows, kx.K) else rows
+            wanted = {self._value(v) for v in values}
+            partitions = [p for p in partitions if p in wanted]
+        elif rows is not None:
+            value = self._value(rows)
+            partitions = [p for p in partitions if p == value]
+
+        columns = self._columns
+        if cols is not None:
+            if isinstance(cols, str):
+                cols = [cols]
+            self._validate(cols)
+            columns = cols
+        return PartitionedTable(self.db_root, self.name, self.kind, self.partition_col, partitions, columns)
+
+    def _q_partitions(self, partitions):
+        if self.kind == 'date':
+            return kx.DateVector(partitions)
+        return kx.LongVector(partitions)
+
+    def _read(self, cols=None):
+        """
+        Reads columns of the selected partitions into one in-memory table.
+        """
+        cols = kx.SymbolVector(self._columns if cols is None else cols)
+        # An empty selection reads the first partition for the schema only.
+        parts = self._partitions or _list_partitions(self.db_root, self.name)[1][:1]
+        result = _q_func('part_select')(
+            _hsym(self.db_root), kx.SymbolAtom(self.name), kx.SymbolAtom(self.partition_col),
+            cols, self._q_partitions(parts),
+        )
+        return result if self._partitions else kx.q('0#', result)
+
+    def _groupby(self, by_cols, agg_col, agg):
+        """
+        Groups partition by partition and merges the per-partition partials.
+        """
+        self._validate(by_cols + [agg_col])
+        by, cols = kx.SymbolVector(by_cols), kx.SymbolVector([agg_col])
+        if not self._partitions:
+            return _q_func('group_sum' if agg == 'sum' else 'group_avg')(
+                self._read(by_cols + [agg_col]), by, kx.SymbolAtom(agg_col)
+            )
+
+        partials = _q_func('part_group')(
+            _q_func('group_partial'), _hsym(self.db_root), kx.SymbolAtom(self.name),
+            kx.SymbolAtom(self.partition_col), by, cols, self._q_partitions(self._partitions),
+        )
+        return _q_func('group_final')(
+            _q_func('group_merge')(partials, by, cols), by, cols, cols,
+            kx.SymbolVector(['sum' if agg == 'sum' else 'mean']),
+        )
+
+    def __repr__(self):
+        parts = self._partitions
+        span = f"{parts[0]}..{parts[-1]}" if parts else "none"
+        return (f"PartitionedTable({self.name!r}, {len(parts)} partitions [{span}], "
+                f"columns={self.columns})")
@@ -0,0 +1,103 @@
+"""
+Per-operation profiling for qutePandas functions.
+"""
+
+import json
+from contextlib import contextmanager
+
+from .. import utils
+
+
+def add_hook(hook):
+    """
+    Registers a callable invoked after every instrumented qutePandas call.
+
+    Parameters
+    ----------
+    hook : callable
+        Receives one dict per call with keys 'function', 'wall_s', 'to_q_s'
+        (pandas -> q conversion), 'q_s' (q execution), 'to_python_s'
+        (q -> Python conversion), 'rows_in', 'rows_out', 'return_type',
+        'q_heap_used' (change in ``.Q.w[]`` used bytes), 'q_heap_peak' and
+        'error'. Hooks run synchronously and should be cheap; an exception
+        raised by a hook is logged and does not affect the call.
+    """
+    if not callable(hook):
+        raise ValueError("hook must be callable")
+    utils._profile_hooks.append(hook)
+
+
+def remove_hook(hook):
+    """
+    Unregisters a hook previously passed to add_hook.
+    """
+    try:
+        utils._profile_hooks.remove(hook)
+    except ValueError:
+        pass
+
+
+class Profiler:
+    """
+    Hook that collects profiling records, returned by ``profile()``.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(dict(record))
+
+    def to_pandas(self):
+        """
+        Returns one row per recorded call as a pandas DataFrame.
+        """
+        import pandas as pd
+        return pd.DataFrame(self.records)
+
+    def summary(self):
+        """
+        Returns call counts and summed timings per function, slowest first.
+        """
+        df = self.to_pandas()
+        if df.empty:
+            return df
+        cols = ['wall_s', 'to_q_s', 'q_s', 'to_python_s', 'rows_in']
+        res = df.groupby('function')[cols].sum()
+        res.insert(0, 'calls', df.groupby('function').size())
+        return res.sort_values('wall_s', ascending=False)
+
+    def to_json(self, path=None):
+        """
+        Serialises the records to JSON, writing them to path if given.
+        """
+        text = json.dumps(self.records, indent=2)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+
+@contextmanager
+def profile():
+    """
+    Profiles every qutePandas call made inside the ``with`` block.
+
+    Yields
+    ------
+    Profiler
+        Collector whose ``records``, ``to_pandas()``, ``summary()`` and
+        ``to_json()`` expose the measurements.
+
+    Examples
+    --------
+    >>> with qpd.profile() as prof:
+    ...     qpd.groupby_sum(qpd.dropna(df), 'sym', 'qty')
+    >>> prof.summary()
+    """
+    profiler = Profiler()
+    add_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_hook(profiler)
@@ -0,0 +1,102 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _q_func
+
+
+class LazyDataFrame:
+    """
+    pandas-compatible view over a kdb+ table that converts columns on demand.
+
+    Returned by functions called with ``return_type='l'``. Selecting a column
+    (``res['price']`` or ``res.price``) converts only that column and caches
+    it; selecting a list of columns builds a pandas DataFrame from those
+    columns alone. Any other pandas attribute or method is served by
+    materialising the full DataFrame once, reusing columns that were already
+    converted.
+    """
+
+    def __init__(self, table):
+        self._table = table
+        self._columns = kx.q("cols", table).py()
+        self._converted = {}
+        self._frame = None
+        self._len = None
+
+    @property
+    def q(self):
+        """
+        The underlying pykx Table.
+        """
+        return self._table
+
+    @property
+    def columns(self):
+        return pd.Index(self._columns)
+
+    @property
+    def shape(self):
+        return (len(self), len(self._columns))
+
+    @property
+    def dtypes(self):
+        return self.head(0).dtypes
+
+    def __len__(self):
+        if self._len is None:
+            self._len = kx.q("count", self._table).py()
+        return self._len
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __contains__(self, col):
+        return col in self._columns
+
+    def _column(self, col):
+        series = self._converted.get(col)
+        if series is None:
+            if col not in self._columns:
+                raise KeyError(col)
+            values = _q_func('get_col')(self._table, kx.SymbolAtom(col)).pd()
+            series = self._converted[col] = pd.Series(values, name=col)
+        return series
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._column(key)
+        if isinstance(key, (list, tuple, pd.Index)) and all(isinstance(k, str) for k in key):
+            return pd.DataFrame({c: self._column(c) for c in key}, columns=list(key))
+        return self.to_pandas()[key]
+
+    def head(self, n=5):
+        """
+        Converts only the first n rows.
+        """
+        return _q_func('head')(self._table, n).pd()
+
+    def to_pandas(self):
+        """
+        Materialises the full pandas DataFrame, reusing converted columns.
+        """
+        if self._frame is None:
+            if not self._columns:
+                self._frame = pd.DataFrame(index=range(len(self)))
+            else:
+                self._frame = pd.DataFrame({c: self._column(c) for c in self._columns}, columns=self._columns)
+        return self._frame
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in self._columns:
+            return self._column(name)
+        return getattr(self.to_pandas(), name)
+
+    def __repr__(self):
+        if self._frame is not None:
+            return repr(self._frame)
+        return (
+            f"{self.head()!r}\n\n"
+            f"[LazyDataFrame: {len(self)} rows x {len(self._columns)} columns, "
+            f"{len(self._converted)} converted]"
+        )
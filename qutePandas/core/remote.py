@@ -0,0 +1,199 @@
+"""
+Remote execution against a kdb+ server over IPC.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+
+import pykx as kx
+
+from ..utils import _Q_LAMBDAS, _ensure_q_table, _handle_return, _instrument
+
+# Defined on the server once per pooled connection, so collect sends only
+# the function name and the expression nodes.
+_SERVER_SETUP = ".qpd.lazyRun:" + _Q_LAMBDAS['lazy_run']
+
+
+class RemoteSession:
+    """
+    Thread-safe pool of IPC connections to a kdb+ server.
+
+    Returned by ``qpd.connect(host, port, pool_size=N)``. Operations run
+    server-side against named server tables and only their results are
+    transferred back. Up to ``pool_size`` connections are opened on demand;
+    concurrent callers share them, and callers beyond the pool size wait for
+    a free connection. A connection that fails with anything other than a q
+    error is closed and replaced on next use.
+
+    Examples
+    --------
+    >>> session = qpd.connect('localhost', 5000, pool_size=4)
+    >>> (session.table('trades')
+    ...     .dropna_col('price')
+    ...     .groupby_sum('sym', 'size')
+    ...     .collect(return_type='p'))
+    """
+
+    def __init__(self, host='localhost', port=None, pool_size=1, username='', password='', timeout=0.0, tls=False):
+        if port is None:
+            raise ValueError("port is required for a remote session")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.host = host
+        self.port = port
+        self.pool_size = pool_size
+        self._conn_kwargs = {'username': username, 'password': password, 'timeout': timeout, 'tls': tls}
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._closed = False
+
+        # Open the first connection eagerly so bad hosts or credentials fail here.
+        with self.connection():
+            pass
+
+    def _new_connection(self):
+        try:
+            conn = kx.SyncQConnection(self.host, self.port, **self._conn_kwargs)
+        except Exception as e:
+            raise RuntimeError(f"Failed to connect to kdb+ server at {self.host}:{self.port}: {e}")
+        try:
+            conn(_SERVER_SETUP)
+        except Exception as e:
+            conn.close()
+            raise RuntimeError(f"Failed to prepare kdb+ server at {self.host}:{self.port}: {e}")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrows a pooled ``pykx.SyncQConnection`` for the duration of the block.
+        """
+        if self._closed:
+            raise RuntimeError("Remote session is closed")
+
+        self._slots.acquire()
+        conn = None
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._new_connection()
+            yield conn
+        except kx.QError:
+            self._idle.put(conn)
+            conn = None
+            raise
+        except BaseException:
+            if conn is not None:
+                conn.close()
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                if self._closed:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+            self._slots.release()
+
+    def _call(self, query, *args):
+        with self.connection() as conn:
+            return conn(query, *args)
+
+    @_instrument
+    def query(self, expr, *args, return_type='q'):
+        """
+        Evaluates a q expression on the server, optionally applied to arguments.
+
+        Parameters
+        ----------
+        expr : str
+            q expression or lambda, e.g. ``'{select from trades where sym=x}'``.
+        *args
+            Arguments passed to the lambda.
+        return_type : str, default 'q'
+            Desired return type ('p', 'q', 'a', 'n' or 'l').
+        """
+        try:
+            return _handle_return(self._call(expr, *args), return_type)
+        except Exception as e:
+            raise RuntimeError(f"Failed to run remote query: {e}")
+
+    def tables(self):
+        """
+        Returns the names of the tables defined in the server's root namespace.
+        """
+        return self._call('tables[]').py()
+
+    def table(self, name):
+        """
+        Starts a LazyFrame pipeline over a named server table.
+
+        Steps are recorded locally and compiled and executed on the server by
+        ``collect``, so only the final result crosses the connection and no
+        local q is needed.
+
+        Parameters
+        ----------
+        name : str
+            Name of a global table on the server.
+
+        Returns
+        -------
+        LazyFrame
+            Pipeline bound to this session.
+        """
+        from .lazy import LazyFrame
+        try:
+            cols = self._call('cols', kx.SymbolAtom(name)).py()
+        except Exception as e:
+            raise RuntimeError(f"Failed to read schema of remote table '{name}': {e}")
+        return LazyFrame(None, [LazyFrame._new_stage(cols)], source=(self, name))
+
+    def upload(self, name, df):
+        """
+        Sends a table to the server and assigns it to a global name.
+
+        Parameters
+        ----------
+        name : str
+            Global name to assign on the server.
+        df : pandas.DataFrame or pykx.Table
+            Table to send.
+
+        Returns
+        -------
+        str
+            The assigned name.
+        """
+        try:
+            self._call('set', kx.SymbolAtom(name), _ensure_q_table(df))
+            return name
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload table '{name}': {e}")
+
+    def _run_stages(self, name, q_stages):
+        return self._call('.qpd.lazyRun', kx.SymbolAtom(name), q_stages)
+
+    def close(self):
+        """
+        Closes every pooled connection. Borrowed connections close when returned.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        state = 'closed' if self._closed else f'{self._idle.qsize()} idle'
+        return f"<RemoteSession {self.host}:{self.port} pool_size={self.pool_size} ({state})>"
@@ -1,4 +1,5 @@
 from .groupby_sum import groupby_sum
 from .groupby_avg import groupby_avg
+from .groupby_chunked import groupby_chunked
 
-__all__ = ['groupby_sum', 'groupby_avg'] 
\ No newline at end of file
+__all__ = ['groupby_sum', 'groupby_avg', 'groupby_chunked']
\ No newline at end of file
@@ -1,22 +1,25 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return, _validate_columns
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
+from ..core.partitioned import PartitionedTable
 
 
+@_instrument
 def groupby_avg(df, by_cols, avg_col, return_type='q'):
     """
     Groups table by specified column(s) and averages target column.
 
     Parameters
     ----------
-    df : pandas.DataFrame or pykx.Table
-        Input DataFrame.
+    df : pandas.DataFrame, pykx.Table or PartitionedTable
+        Input DataFrame. A PartitionedTable is grouped partition by
+        partition, reading only its selected partitions.
     by_cols : str or list of str
         Group by column(s).
     avg_col : str
         Column to average.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -24,15 +27,15 @@ def groupby_avg(df, by_cols, avg_col, return_type='q'):
         Grouped and averaged DataFrame.
     """
     try:
-        q_table = _ensure_q_table(df)
         if isinstance(by_cols, str):
             by_cols = [by_cols]
+        if isinstance(df, PartitionedTable):
+            return _handle_return(df._groupby(by_cols, avg_col, 'avg'), return_type)
+
+        q_table = _ensure_q_table(df)
         
         _validate_columns(q_table, by_cols + [avg_col])
-        by_clause = ",".join(by_cols)
-        
-        keyed_result = kx.q(f"{{select avg {avg_col} by {by_clause} from x}}", q_table)
-        result = kx.q("{0!x}", keyed_result)
+        result = _q_func('group_avg')(q_table, kx.SymbolVector(by_cols), kx.SymbolAtom(avg_col))
         return _handle_return(result, return_type)
     except Exception as e:
         raise RuntimeError(f"Failed to group by avg: {e}")
@@ -0,0 +1,162 @@
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pykx as kx
+import pandas as pd
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
+
+_AGGS = ('sum', 'count', 'min', 'max', 'mean', 'var', 'std')
+
+# Partials are merged once this many have accumulated, bounding memory to
+# roughly this many per-chunk group tables.
+_MERGE_EVERY = 16
+
+
+def _iter_chunks(data, chunksize):
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start:start + chunksize]
+    elif isinstance(data, (kx.Table, kx.KeyedTable)):
+        if isinstance(data, kx.KeyedTable):
+            data = _q_func('unkey')(data)
+        head = _q_func('head')
+        for start in range(0, len(data), chunksize):
+            yield head(data, kx.LongVector([start, chunksize]))
+    else:
+        yield from data
+
+
+def _serialize(q_object):
+    return kx.q("-8!", q_object).np().tobytes()
+
+
+def _deserialize(payload):
+    return kx.q("-9!", kx.ByteVector(np.frombuffer(payload, dtype=np.uint8)))
+
+
+def _partial(chunk, by_cols, agg_cols):
+    """
+    Per-chunk sum, non-null count, min, max and float sum of squares by key.
+    """
+    q_table = _ensure_q_table(chunk)
+    _validate_columns(q_table, by_cols + agg_cols)
+    return _q_func('group_partial')(q_table, kx.SymbolVector(by_cols), kx.SymbolVector(agg_cols))
+
+
+def _partial_task(chunk, by_cols, agg_cols):
+    # Runs in a worker process: q tables travel in kdb+ IPC format, pandas
+    # chunks are pickled and converted here, in parallel.
+    if isinstance(chunk, bytes):
+        chunk = _deserialize(chunk)
+    return _serialize(_partial(chunk, by_cols, agg_cols))
+
+
+def _pack(chunk):
+    if isinstance(chunk, (kx.Table, kx.KeyedTable)):
+        return _serialize(chunk)
+    return chunk
+
+
+class _Partials:
+    def __init__(self, by_cols, agg_cols):
+        self._by = kx.SymbolVector(by_cols)
+        self._cols = kx.SymbolVector(agg_cols)
+        self._pending = []
+
+    def add(self, partial):
+        self._pending.append(partial)
+        if len(self._pending) >= _MERGE_EVERY:
+            self._pending = [self.merged()]
+
+    def merged(self):
+        if not self._pending:
+            raise ValueError("No data to group: the input produced no chunks")
+        return _q_func('group_merge')(kx.toq(self._pending), self._by, self._cols)
+
+
+@_instrument
+def groupby_chunked(data, by_cols, agg_cols, aggs='sum', chunksize=1_000_000, workers=None, return_type='q'):
+    """
+    Groups a table chunk by chunk, merging partial aggregates exactly.
+
+    Each chunk is reduced to per-group sum, non-null count, min, max and sum
+    of squares; partials are merged as they arrive and the requested
+    aggregates are derived from the merged totals. Only one chunk per worker
+    plus the partials is held at a time, so iterables of chunks larger than
+    memory in total can be grouped. Sums, counts, min and max equal the
+    single-pass result; mean, var and std are computed from the merged sums
+    and may differ from a single pass in the last floating-point digits.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame, pykx.Table or iterable
+        Input table, split into chunks of chunksize rows, or an iterable of
+        pandas DataFrames or pykx Tables used as the chunks directly.
+    by_cols : str or list of str
+        Group by column(s).
+    agg_cols : str or list of str
+        Column(s) to aggregate.
+    aggs : str or list of str, default 'sum'
+        Aggregates from 'sum', 'count' (non-null), 'min', 'max', 'mean',
+        'var' and 'std' (sample, ddof=1). With a single aggregate the result
+        columns keep the agg_cols names, as in groupby_sum and groupby_avg;
+        otherwise they are named '<col>_<agg>'.
+    chunksize : int, default 1_000_000
+        Rows per chunk when data is a table.
+    workers : int, optional
+        Number of worker processes computing partials in parallel. Each
+        worker starts its own embedded q. By default chunks are processed
+        in this process.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pandas.DataFrame or pykx.Table
+        One row per group, sorted by the group columns.
+    """
+    try:
+        if isinstance(by_cols, str):
+            by_cols = [by_cols]
+        if isinstance(agg_cols, str):
+            agg_cols = [agg_cols]
+        single = isinstance(aggs, str)
+        if single:
+            aggs = [aggs]
+        aggs = ['mean' if a == 'avg' else a for a in aggs]
+        unknown = [a for a in aggs if a not in _AGGS]
+        if unknown:
+            raise ValueError(f"Unsupported aggregates {unknown}; choose from {list(_AGGS)}")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+
+        partials = _Partials(by_cols, agg_cols)
+        chunks = _iter_chunks(data, chunksize)
+
+        if workers is None:
+            for chunk in chunks:
+                partials.add(_partial(chunk, by_cols, agg_cols))
+        else:
+            # spawn: a forked child would share the parent's embedded q state.
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                in_flight = set()
+                for chunk in chunks:
+                    in_flight.add(pool.submit(_partial_task, _pack(chunk), by_cols, agg_cols))
+                    if len(in_flight) >= 2 * workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for f in done:
+                            partials.add(_deserialize(f.result()))
+                for f in wait(in_flight).done:
+                    partials.add(_deserialize(f.result()))
+
+        pairs = [(c, a) for c in agg_cols for a in aggs]
+        names = [c if single else f"{c}_{a}" for c, a in pairs]
+        result = _q_func('group_final')(
+            partials.merged(), kx.SymbolVector(by_cols), kx.SymbolVector(names),
+            kx.SymbolVector([c for c, _ in pairs]), kx.SymbolVector([a for _, a in pairs]),
+        )
+        return _handle_return(result, return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to group by chunks: {e}")
@@ -1,22 +1,25 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return, _validate_columns
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _q_func, _instrument
+from ..core.partitioned import PartitionedTable
 
 
+@_instrument
 def groupby_sum(df, by_cols, sum_col, return_type='q'):
     """
     Groups table by specified column(s) and sums target column.
 
     Parameters
     ----------
-    df : pandas.DataFrame or pykx.Table
-        Input DataFrame.
+    df : pandas.DataFrame, pykx.Table or PartitionedTable
+        Input DataFrame. A PartitionedTable is grouped partition by
+        partition, reading only its selected partitions.
     by_cols : str or list of str
         Group by column(s).
     sum_col : str
         Column to sum.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -24,15 +27,15 @@ def groupby_sum(df, by_cols, sum_col, return_type='q'):
         Grouped and summed DataFrame.
     """
     try:
-        q_table = _ensure_q_table(df)
         if isinstance(by_cols, str):
             by_cols = [by_cols]
+        if isinstance(df, PartitionedTable):
+            return _handle_return(df._groupby(by_cols, sum_col, 'sum'), return_type)
+
+        q_table = _ensure_q_table(df)
         
         _validate_columns(q_table, by_cols + [sum_col])
-        by_clause = ",".join(by_cols)
-        
-        keyed_result = kx.q(f"{{select sum {sum_col} by {by_clause} from x}}", q_table)
-        result = kx.q("{0!x}", keyed_result)
+        result = _q_func('group_sum')(q_table, kx.SymbolVector(by_cols), kx.SymbolAtom(sum_col))
         
         return _handle_return(result, return_type)
     except Exception as e:
@@ -1,6 +1,7 @@
 import pykx as kx
-from ..utils import _ensure_q_table, _handle_return, _validate_columns
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _instrument
 
+@_instrument
 def iloc(df, rows=None, cols=None, return_type='q'):
     """
     Pure integer-location based indexing for selection by position.
@@ -14,7 +15,8 @@ def iloc(df, rows=None, cols=None, return_type='q'):
     cols : int, list, slice, or None
         Column indices to select.
     return_type : str, default 'q'
-        'q' for pykx.Table, 'p' for pandas DataFrame.
+        'q' for pykx.Table, 'p' for pandas DataFrame, 'a' for pyarrow.Table,
+        'n' for a dict of NumPy arrays, 'l' for a lazily converted pandas view.
         
     Returns
     -------
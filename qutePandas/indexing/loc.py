@@ -1,26 +1,34 @@
 import pykx as kx
-from ..utils import _ensure_q_table, _handle_return, _validate_columns
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _instrument
+from ..core.partitioned import PartitionedTable
 
+@_instrument
 def loc(df, rows=None, cols=None, return_type='q'):
     """
     Pure label-location based indexing for selection by label (or boolean array).
     
     Parameters
     ----------
-    df : pykx.Table or pd.DataFrame
+    df : pykx.Table, pd.DataFrame or PartitionedTable
         Input data.
     rows : list of bool, pykx.BooleanVector, or None
-        Boolean mask for row selection.
+        Boolean mask for row selection. For a PartitionedTable, a partition
+        value, list of values or inclusive slice of values; only those
+        partitions are read.
     cols : str, list of str, or None
         Column names to select.
     return_type : str, default 'q'
-        'q' for pykx.Table, 'p' for pandas DataFrame.
+        'q' for pykx.Table, 'p' for pandas DataFrame, 'a' for pyarrow.Table,
+        'n' for a dict of NumPy arrays, 'l' for a lazily converted pandas view.
         
     Returns
     -------
     pykx.Table or pd.DataFrame
         Subset of the inputs.
     """
+    if isinstance(df, PartitionedTable):
+        return _handle_return(df.loc(rows, cols)._read(), return_type)
+
     table = _ensure_q_table(df)
     
     q_rows = None
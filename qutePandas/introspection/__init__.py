@@ -0,0 +1,4 @@
+from .dtypes import dtypes
+from .memory_usage import memory_usage
+
+__all__ = ['dtypes', 'memory_usage']
@@ -1,6 +1,7 @@
 import pykx as kx
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _instrument
 
+@_instrument
 def dtypes(df, return_type='q'):
     """
     Returns the data types of each column in the DataFrame.
@@ -10,7 +11,7 @@ def dtypes(df, return_type='q'):
     df : pandas.DataFrame or pykx.Table
         Input DataFrame.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -0,0 +1,37 @@
+import pykx as kx
+from ..utils import _ensure_q_table, _handle_return, _instrument, _q_func
+
+
+@_instrument
+def memory_usage(df, deep=False, return_type='q'):
+    """
+    Returns the size in bytes of each column.
+
+    Columns are measured with ``-22!`` (serialized size), except symbol
+    columns: ``-22!`` writes each symbol out as a string, so they are
+    measured as q holds them instead, one 8-byte pointer per element plus
+    the vector header.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame.
+    deep : bool, default False
+        Also count the interned strings behind symbol columns, each distinct
+        symbol once with its null terminator.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pykx.Table or pandas.DataFrame
+        Table with columns 'column' and 'bytes'.
+    """
+    try:
+        q_table = _ensure_q_table(df)
+        if isinstance(q_table, kx.KeyedTable):
+            q_table = _q_func('unkey')(q_table)
+        res = _q_func('col_bytes')(q_table, kx.BooleanAtom(deep))
+        return _handle_return(res, return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to compute memory usage: {e}")
@@ -1,4 +1,12 @@
 from .to_csv import to_csv
 from .from_csv import from_csv
+from .to_kdb import to_kdb
+from .from_kdb import from_kdb
+from .to_partitioned import to_partitioned
+from .from_partitioned import from_partitioned
+from .to_parquet import to_parquet
+from .from_parquet import from_parquet
+from .to_arrow_ipc import to_arrow_ipc
+from .from_arrow_ipc import from_arrow_ipc
 
-__all__ = ['to_csv', 'from_csv'] 
\ No newline at end of file
+__all__ = ['to_csv', 'from_csv', 'to_kdb', 'from_kdb', 'to_partitioned', 'from_partitioned', 'to_parquet', 'from_parquet', 'to_arrow_ipc', 'from_arrow_ipc']
\ No newline at end of file
@@ -0,0 +1,45 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _handle_return, _instrument
+
+
+@_instrument
+def from_arrow_ipc(path, columns=None, memory_map=True, return_type='q'):
+    """
+    Imports DataFrame from an Arrow IPC file (Feather v2).
+
+    With memory_map the file is opened through ``pyarrow.memory_map`` and
+    the record batches reference the mapped pages directly, with no
+    parsing or decode step; only the conversion to q copies data, and only
+    for the selected columns. With return_type 'a' the mapped Arrow table
+    is returned as is, without any copy.
+
+    Parameters
+    ----------
+    path : str
+        Arrow IPC file written by to_arrow_ipc or any Arrow/Feather v2 writer.
+    columns : list of str, optional
+        Columns to load, in this order.
+    memory_map : bool, default True
+        Map the file instead of reading it into memory.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pandas.DataFrame, pykx.Table or pyarrow.Table
+        Loaded DataFrame.
+    """
+    try:
+        import pyarrow as pa
+
+        source = pa.memory_map(path, 'r') if memory_map else pa.OSFile(path, 'rb')
+        with source:
+            pa_tab = pa.ipc.open_file(source).read_all()
+            if columns is not None:
+                pa_tab = pa_tab.select(list(columns))
+            if return_type == 'a':
+                return pa_tab
+            return _handle_return(kx.toq(pa_tab), return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load Arrow IPC file {path}: {e}")
@@ -1,27 +1,265 @@
+import glob
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pykx as kx
 import pandas as pd
-from ..utils import _handle_return
-import pyarrow.csv as pa_csv
+from ..utils import _handle_return, _q_func, _instrument
+from ..transformation.cast import _Q_TYPE_MAP
+
+_append_ids = itertools.count()
+
+# dtype names accepted by from_csv, mapped to kdb+ type characters. 's' and
+# 'C' are parsed as Arrow strings and fixed up to symbols or char lists in q.
+_CSV_TYPES = {
+    **_Q_TYPE_MAP,
+    'symbol': 's', 'C': 'C', 'char': 'C',
+    'bool': 'b', 'boolean': 'b', 'b': 'b',
+    'timestamp': 'p', 'datetime64[ns]': 'p', 'p': 'p',
+    'date': 'd', 'd': 'd',
+}
+
+_ARROW_TYPES = {
+    'j': 'int64', 'i': 'int32', 'h': 'int16', 'f': 'float64', 'e': 'float32',
+    'b': 'bool_', 'd': 'date32', 's': 'string', 'C': 'string', 'c': 'string',
+}
+
+
+class _CsvOptions:
+    """
+    pyarrow read/parse/convert options plus the q text types to enforce.
+    """
+
+    def __init__(self, usecols=None, dtype=None, delimiter=',', skiprows=0, na_values=None, timestamp_format=None):
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        column_types = {}
+        self.text_cols = {}
+        for col, kind in (dtype or {}).items():
+            q_type = _CSV_TYPES.get(kind)
+            if q_type is None:
+                raise ValueError(f"Unsupported dtype '{kind}' for column '{col}'")
+            if q_type == 'p':
+                column_types[col] = pa.timestamp('ns')
+            else:
+                column_types[col] = getattr(pa, _ARROW_TYPES[q_type])()
+            # Columns excluded by usecols never reach q.
+            if q_type in ('s', 'C', 'c') and (usecols is None or col in usecols):
+                self.text_cols[col] = 's' if q_type == 's' else 'C'
+
+        convert = {'column_types': column_types}
+        if usecols is not None:
+            convert['include_columns'] = list(usecols)
+        if na_values is not None:
+            if isinstance(na_values, str):
+                na_values = [na_values]
+            convert['null_values'] = list(pa_csv.ConvertOptions().null_values) + list(na_values)
+            convert['strings_can_be_null'] = True
+        if timestamp_format is not None:
+            if isinstance(timestamp_format, str):
+                timestamp_format = [timestamp_format]
+            convert['timestamp_parsers'] = list(timestamp_format)
+
+        self.read = pa_csv.ReadOptions(skip_rows=skiprows)
+        self.parse = pa_csv.ParseOptions(delimiter=delimiter)
+        self.convert = pa_csv.ConvertOptions(**convert)
+
+    def to_q(self, arrow_table):
+        q_table = kx.toq(arrow_table)
+        if self.text_cols:
+            q_table = _q_func('text_cols')(
+                q_table, kx.SymbolVector(list(self.text_cols)), kx.SymbolVector(list(self.text_cols.values()))
+            )
+        return q_table
+
+
+def _open_batches(path, opts):
+    import pyarrow.csv as pa_csv
+    return pa_csv.open_csv(path, read_options=opts.read, parse_options=opts.parse, convert_options=opts.convert)
+
+
+def _rebatch(batches, chunksize):
+    """
+    Regroups Arrow record batches into Arrow tables of exactly chunksize rows.
+    """
+    import pyarrow as pa
+
+    pending, rows = [], 0
+    for batch in batches:
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunksize)
+            rest = table.slice(chunksize)
+            pending, rows = rest.to_batches(), rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending)
+
+
+def _iter_chunks(reader, path, opts, chunksize, return_type):
+    try:
+        for table in _rebatch(reader, chunksize):
+            yield _handle_return(opts.to_q(table), return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load CSV file {path}: {e}")
+
 
-def from_csv(path, return_type='q'):
+def _append_all(path, opts, chunksize):
+    """
+    Appends converted batches in place to a temporary q global, so peak
+    memory is the growing q table plus one batch.
+    """
+    import pyarrow as pa
+
+    reader = _open_batches(path, opts)
+    if chunksize is None:
+        tables = (pa.Table.from_batches([b]) for b in reader)
+    else:
+        tables = _rebatch(reader, chunksize)
+
+    name = kx.SymbolAtom(f".qpd.csv{next(_append_ids)}")
+    created = False
+    try:
+        for table in tables:
+            _q_func('append_global' if created else 'set_global')(name, opts.to_q(table))
+            created = True
+    except Exception:
+        if created:
+            _q_func('pop_global')(name)
+        raise
+
+    if not created:
+        return opts.to_q(reader.schema.empty_table())
+    return _q_func('pop_global')(name)
+
+
+def _expand_paths(path):
+    """
+    Returns the sorted files matched by a glob pattern or list of paths, or
+    None for a single plain path.
+    """
+    if isinstance(path, (list, tuple)):
+        return list(path)
+    if not glob.has_magic(str(path)):
+        return None
+    paths = sorted(glob.glob(str(path)))
+    if not paths:
+        raise FileNotFoundError(f"No files match {path}")
+    return paths
+
+
+def _read_many(paths, opts, workers, source_col):
+    """
+    Parses files concurrently and concatenates them into one Arrow table,
+    promoting differing column types and filling missing columns with nulls.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    def read(file_path):
+        return pa_csv.read_csv(file_path, read_options=opts.read, parse_options=opts.parse,
+                               convert_options=opts.convert)
+
+    # pyarrow releases the GIL while parsing, so threads parse in parallel.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        tables = list(pool.map(read, paths))
+    combined = pa.concat_tables(tables, promote_options='permissive')
+    if source_col is not None:
+        names = pa.chunked_array(
+            [pa.repeat(os.path.basename(p), t.num_rows) for p, t in zip(paths, tables)], type=pa.string()
+        )
+        combined = combined.append_column(source_col, names)
+    return combined
+
+
+@_instrument
+def from_csv(path, return_type='q', chunksize=None, append=False, usecols=None, dtype=None,
+             delimiter=',', skiprows=0, na_values=None, timestamp_format=None, workers=None, source_col=None):
     """
     Imports DataFrame from CSV file.
 
     Parameters
     ----------
-    path : str
-        File path to load CSV from.
+    path : str or list of str
+        File path to load CSV from, a glob pattern such as 'data/*.csv', or
+        a list of paths. Several files are parsed concurrently and combined
+        into one table.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+    chunksize : int, optional
+        Rows per chunk. Without append, returns an iterator of tables of
+        this many rows, reading the file incrementally with
+        ``pyarrow.csv.open_csv``.
+    append : bool, default False
+        Read the file batch by batch and append each batch in place to one
+        q table, instead of converting a full Arrow copy of the file.
+        chunksize, if given, sets the batch size in rows.
+    usecols : list of str, optional
+        Columns to load, in this order. Other columns are never converted.
+    dtype : dict, optional
+        Column name to type, as a kdb+ type character ('j', 'i', 'h', 'f',
+        'e', 'b', 'd', 'p', 's' for symbol, 'C' for char list) or a name
+        such as 'int64', 'float32', 'symbol', 'string', 'bool', 'date' or
+        'timestamp'. Typed columns skip inference.
+    delimiter : str, default ','
+        Field delimiter.
+    skiprows : int, default 0
+        Lines to skip before the header.
+    na_values : str or list of str, optional
+        Extra strings read as null, in addition to pyarrow's defaults.
+    timestamp_format : str or list of str, optional
+        strptime-style formats tried when parsing timestamp columns.
+    workers : int, optional
+        Threads parsing files concurrently when path names several files.
+        Defaults to the ThreadPoolExecutor default.
+    source_col : str, optional
+        Adds a symbol column of this name holding the base name of the file
+        each row came from.
 
     Returns
     -------
-    pandas.DataFrame or pykx.Table
-        Loaded DataFrame.
+    pandas.DataFrame or pykx.Table or iterator
+        Loaded DataFrame, or an iterator of chunks when chunksize is given
+        without append.
+
+    Notes
+    -----
+    Streaming reads infer untyped columns from the first block of the file.
+    Files with different columns or types are combined by promoting types
+    (for example int64 and float64 to float64) and filling columns missing
+    from a file with nulls. Files are concatenated in sorted path order with
+    a single Arrow concat and converted to q once.
     """
-    try:       
-        pa_tab = pa_csv.read_csv(path)
-        q_table = kx.toq(pa_tab)
+    try:
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+
+        opts = _CsvOptions(usecols, dtype, delimiter, skiprows, na_values, timestamp_format)
+
+        paths = _expand_paths(path)
+        if paths is None and source_col is not None:
+            paths = [path]
+        if paths is not None:
+            if chunksize is not None or append:
+                raise ValueError("chunksize and append read a single file; pass one path")
+            if source_col is not None:
+                opts.text_cols[source_col] = 's'
+            return _handle_return(opts.to_q(_read_many(paths, opts, workers, source_col)), return_type)
+
+        if chunksize is not None and not append:
+            return _iter_chunks(_open_batches(path, opts), path, opts, chunksize, return_type)
+
+        if append:
+            q_table = _append_all(path, opts, chunksize)
+        else:
+            import pyarrow.csv as pa_csv
+
+            pa_tab = pa_csv.read_csv(path, read_options=opts.read, parse_options=opts.parse,
+                                     convert_options=opts.convert)
+            q_table = opts.to_q(pa_tab)
         return _handle_return(q_table, return_type)
     except Exception as e:
-        raise RuntimeError(f"Failed to load CSV file {path}: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to load CSV file {path}: {e}")
@@ -0,0 +1,47 @@
+import os
+
+import pykx as kx
+from ..utils import _handle_return, _hsym, _q_func, _instrument
+
+
+@_instrument
+def from_kdb(path, mmap=True, db_root=None, return_type='q'):
+    """
+    Loads a kdb+ splayed table saved by to_kdb.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the splayed table.
+    mmap : bool, default True
+        Memory-map the column files instead of reading them. Loading is then
+        near-instant, columns are paged in on access, and processes mapping
+        the same table share the OS page cache. Symbol columns are always
+        de-enumerated into plain symbols, which reads them into the q heap.
+        With False every column is copied into the q heap.
+    db_root : str, optional
+        Directory holding the sym file. Defaults to the parent of path.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pandas.DataFrame or pykx.Table
+        Loaded table.
+
+    Notes
+    -----
+    Loading assigns the q global ``sym`` from db_root, as q's own ``\\l``
+    does, but symbol columns are decoded before returning, so tables loaded
+    from different roots can be used side by side.
+    """
+    try:
+        if not os.path.isdir(path):
+            raise ValueError(f"Splayed table directory not found: {path}")
+        if db_root is None:
+            db_root = os.path.dirname(os.path.abspath(path))
+
+        result = _q_func('load_splay')(_hsym(path, directory=True), _hsym(db_root), kx.BooleanAtom(mmap))
+        return _handle_return(result, return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load splayed table from {path}: {e}")
@@ -0,0 +1,46 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _handle_return, _instrument
+
+
+@_instrument
+def from_parquet(path, columns=None, filters=None, return_type='q'):
+    """
+    Imports DataFrame from Parquet file(s).
+
+    Reads through ``pyarrow.dataset``: only the requested columns are
+    decoded, and row groups (and hive partition directories) whose
+    statistics cannot satisfy filters are skipped before anything is
+    converted to q.
+
+    Parameters
+    ----------
+    path : str or list of str
+        Parquet file, directory of files (hive partitioning such as
+        ``date=2024-01-01/`` is recognised) or list of files.
+    columns : list of str, optional
+        Columns to load, in this order.
+    filters : list or pyarrow.dataset.Expression, optional
+        Row filter, as a ``pyarrow.dataset`` expression or in the
+        ``pandas.read_parquet`` form: a list of ``(column, op, value)``
+        tuples combined with AND, or a list of such lists combined with OR.
+    return_type : str, default 'q'
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
+
+    Returns
+    -------
+    pandas.DataFrame or pykx.Table
+        Loaded DataFrame.
+    """
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        if filters is not None and not isinstance(filters, ds.Expression):
+            filters = pq.filters_to_expression(filters)
+
+        dataset = ds.dataset(path, format='parquet', partitioning='hive')
+        pa_tab = dataset.to_table(columns=columns, filter=filters)
+        return _handle_return(kx.toq(pa_tab), return_type)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load Parquet file {path}: {e}")
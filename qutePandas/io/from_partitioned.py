@@ -0,0 +1,55 @@
+import os
+
+import pykx as kx
+from ..utils import _hsym, _q_func, _instrument
+from ..core.partitioned import PartitionedTable, _list_partitions
+
+
+@_instrument
+def from_partitioned(db_root, table, partition_col=None):
+    """
+    Opens a table of a partitioned kdb+ database written by to_partitioned.
+
+    Nothing is read besides the directory listing, the column names and the
+    sym file. Select partitions with ``PartitionedTable.loc`` or
+    ``qpd.loc``; ``qpd.loc``, ``qpd.groupby_sum`` and ``qpd.groupby_avg``
+    read only the selected partitions and the columns they use.
+
+    Parameters
+    ----------
+    db_root : str
+        Database directory.
+    table : str
+        Table name.
+    partition_col : str, optional
+        Name of the virtual partition column. Defaults to 'date' for date
+        partitions and 'int' for integer partitions, as in kdb+.
+
+    Returns
+    -------
+    PartitionedTable
+        Lazily opened table over every partition.
+
+    Examples
+    --------
+    >>> trades = qpd.from_partitioned('db', 'trades')
+    >>> week = trades.loc(slice('2024-01-01', '2024-01-07'))
+    >>> qpd.groupby_sum(week, 'sym', 'size')
+    """
+    try:
+        if not os.path.isdir(db_root):
+            raise ValueError(f"Database directory not found: {db_root}")
+        kind, partitions = _list_partitions(db_root, table)
+
+        root = _hsym(db_root)
+        _q_func('load_sym')(root)
+        last = partitions[-1]
+        part_dir = last.strftime('%Y.%m.%d') if kind == 'date' else str(last)
+        columns = _q_func('splay_cols')(_hsym(os.path.join(db_root, part_dir, table), directory=True)).py()
+
+        partition_col = partition_col or kind
+        if partition_col in columns:
+            raise ValueError(f"Partition column '{partition_col}' clashes with a stored column")
+        return PartitionedTable(db_root, table, kind, partition_col, partitions, [partition_col] + columns)
+    except Exception as e:
+        raise RuntimeError(f"Failed to open partitioned table {table} in {db_root}: {e}")
@@ -0,0 +1,49 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _instrument
+from .to_parquet import _arrow_batches
+
+
+@_instrument
+def to_arrow_ipc(df, path, chunksize=1_000_000, compression=None):
+    """
+    Exports DataFrame to an Arrow IPC file (Feather v2).
+
+    Batches of chunksize rows are converted and appended one at a time, so
+    memory use is bounded by chunksize. Uncompressed files can be memory
+    mapped by from_arrow_ipc, pyarrow, polars or DuckDB without decoding.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame. Keyed tables are saved unkeyed.
+    path : str
+        File path to save to, conventionally ending in .arrow or .feather.
+    chunksize : int, default 1_000_000
+        Rows per record batch.
+    compression : str, optional
+        'lz4' or 'zstd' buffer compression. Compressed files are smaller
+        but must be decompressed when read, so they cannot be mapped
+        without a copy.
+
+    Returns
+    -------
+    str
+        Success message.
+    """
+    try:
+        import pyarrow as pa
+
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+
+        batches = _arrow_batches(df, chunksize)
+        first = next(batches)
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, first.schema, options=options) as writer:
+            writer.write_table(first)
+            for batch in batches:
+                writer.write_table(batch)
+        return f"Table saved to: {path}"
+    except Exception as e:
+        raise RuntimeError(f"Failed to save table to Arrow IPC: {e}")
@@ -1,18 +1,42 @@
 import pykx as kx
 import pandas as pd
-import pyarrow.csv as pa_csv
-from ..utils import _ensure_q_table
+from ..utils import _instrument
+from .to_parquet import _arrow_batches
 
-def to_csv(df, path):
+_COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+
+def _codec(path, compression):
+    if compression == 'infer':
+        return next((codec for suffix, codec in _COMPRESSION_SUFFIXES.items() if str(path).endswith(suffix)), None)
+    if compression not in (None, 'gzip', 'zstd'):
+        raise ValueError(f"Unsupported compression '{compression}'; use 'gzip', 'zstd', 'infer' or None")
+    return compression
+
+
+@_instrument
+def to_csv(df, path, chunksize=1_000_000, compression='infer'):
     """
     Exports DataFrame to CSV file.
 
+    The table is sliced into chunks of rows and each chunk is written before
+    the next is taken, so memory use is bounded by chunksize rather than by
+    the table. q tables are converted to Arrow chunk by chunk and written
+    through ``pyarrow.csv.CSVWriter``; pandas input is formatted by
+    ``pandas.DataFrame.to_csv`` one chunk at a time, with the header on the
+    first chunk only, so its quoting and value formatting are unchanged.
+
     Parameters
     ----------
     df : pandas.DataFrame or pykx.Table
         Input DataFrame.
     path : str
         File path to save CSV.
+    chunksize : int, default 1_000_000
+        Rows converted and written per chunk.
+    compression : str or None, default 'infer'
+        'gzip' or 'zstd' to compress the stream, None for plain text, or
+        'infer' to pick from the path suffix (.gz, .zst).
 
     Returns
     -------
@@ -20,20 +44,30 @@ def to_csv(df, path):
         Success message.
     """
     try:
-        if hasattr(df, 'pa'):
-            pa_tab = df.pa()
-            pa_csv.write_csv(pa_tab, path)
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+        codec = _codec(path, compression)
+        if not isinstance(df, (pd.DataFrame, kx.Table, kx.KeyedTable)):
+            df = pd.DataFrame(df)
+
+        sink = pa.CompressedOutputStream(path, codec) if codec else pa.OSFile(path, 'wb')
+        if isinstance(df, pd.DataFrame):
+            with sink:
+                for start in range(0, max(len(df), 1), chunksize):
+                    chunk = df.iloc[start:start + chunksize]
+                    sink.write(chunk.to_csv(index=False, header=start == 0).encode())
             return f"Table saved to: {path}"
-        
-        if isinstance(df, (kx.Table, kx.KeyedTable)):
-            pd_df = df.pd()
-        elif isinstance(df, pd.DataFrame):
-            pd_df = df
-        else:
-            pd_df = pd.DataFrame(df)
-            
-        pd_df.to_csv(path, index=False)
+
+        batches = _arrow_batches(df, chunksize)
+        first = next(batches)
+        with sink, pa_csv.CSVWriter(sink, first.schema) as writer:
+            writer.write_table(first)
+            for batch in batches:
+                writer.write_table(batch)
         return f"Table saved to: {path}"
 
     except Exception as e:
-        raise RuntimeError(f"Failed to save table to CSV: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to save table to CSV: {e}")
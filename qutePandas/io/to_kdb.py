@@ -0,0 +1,41 @@
+import os
+
+import pykx as kx
+from ..utils import _ensure_q_table, _hsym, _q_func, _instrument
+
+
+@_instrument
+def to_kdb(df, path, db_root=None):
+    """
+    Saves a table to disk as a kdb+ splayed table.
+
+    Each column is written to its own file under path. Symbol columns are
+    enumerated against the ``sym`` file in db_root, which is created or
+    extended as needed, so several tables saved under one root share it.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame. Keyed tables are saved unkeyed.
+    path : str
+        Directory to write the splayed table to, e.g. 'db/trades'.
+    db_root : str, optional
+        Directory holding the sym file. Defaults to the parent of path.
+
+    Returns
+    -------
+    str
+        Success message.
+    """
+    try:
+        q_table = _ensure_q_table(df)
+        if isinstance(q_table, kx.KeyedTable):
+            q_table = _q_func('unkey')(q_table)
+        if db_root is None:
+            db_root = os.path.dirname(os.path.abspath(path))
+        os.makedirs(db_root, exist_ok=True)
+
+        _q_func('splay')(_hsym(path, directory=True), _hsym(db_root), q_table)
+        return f"Table saved to: {path}"
+    except Exception as e:
+        raise RuntimeError(f"Failed to save splayed table to {path}: {e}")
@@ -0,0 +1,75 @@
+import pykx as kx
+import pandas as pd
+from ..utils import _ensure_q_table, _q_func, _instrument
+
+
+def _arrow_batches(df, batch_rows):
+    """
+    Yields pyarrow Tables of up to batch_rows rows with one schema, so only
+    one batch is converted at a time.
+    """
+    import pyarrow as pa
+
+    if isinstance(df, pd.DataFrame):
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        for start in range(0, max(len(df), 1), batch_rows):
+            yield pa.Table.from_pandas(df.iloc[start:start + batch_rows], schema=schema, preserve_index=False)
+        return
+
+    q_table = _ensure_q_table(df)
+    if isinstance(q_table, kx.KeyedTable):
+        q_table = _q_func('unkey')(q_table)
+    head = _q_func('head')
+    schema = None
+    for start in range(0, max(len(q_table), 1), batch_rows):
+        batch = head(q_table, kx.LongVector([start, batch_rows])).pa()
+        if schema is None:
+            schema = batch.schema
+        elif batch.schema != schema:
+            batch = batch.cast(schema)
+        yield batch
+
+
+@_instrument
+def to_parquet(df, path, row_group_size=1_000_000, compression='snappy'):
+    """
+    Exports DataFrame to a Parquet file, streaming it in row groups.
+
+    The table is converted to Arrow one row group at a time and each group
+    is written as it is produced, so memory use is bounded by
+    row_group_size rather than by the size of the table.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame. Keyed tables are saved unkeyed.
+    path : str
+        File path to save Parquet.
+    row_group_size : int, default 1_000_000
+        Rows per row group, which is also the conversion batch size.
+    compression : str, default 'snappy'
+        Codec: 'snappy', 'gzip', 'brotli', 'lz4', 'zstd' or 'none'.
+
+    Returns
+    -------
+    str
+        Success message.
+    """
+    try:
+        import pyarrow.parquet as pq
+
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+
+        writer = None
+        try:
+            for batch in _arrow_batches(df, row_group_size):
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+                writer.write_table(batch, row_group_size=row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+        return f"Table saved to: {path}"
+    except Exception as e:
+        raise RuntimeError(f"Failed to save table to Parquet: {e}")
@@ -0,0 +1,62 @@
+import os
+
+import pykx as kx
+from ..utils import _ensure_q_table, _hsym, _q_func, _validate_columns, _instrument
+
+# Partition columns must be dates or integers, as in a kdb+ database.
+_PARTITION_TYPES = {14: 'date', 5: 'int', 6: 'int', 7: 'int'}
+
+
+@_instrument
+def to_partitioned(df, db_root, table, partition_col='date', parted_col=None):
+    """
+    Writes a table into a date- or int-partitioned kdb+ database.
+
+    Rows are split by the value of partition_col and each group is saved as
+    a splayed table under ``db_root/<value>/<table>``, without the partition
+    column, which becomes virtual when the database is opened with
+    from_partitioned. Symbol columns are enumerated against the shared
+    ``db_root/sym`` file. Partitions already on disk for the written values
+    are replaced, including column files left from an older schema; other
+    partitions are left untouched, so a day at a time can be appended.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pykx.Table
+        Input DataFrame. Keyed tables are saved unkeyed.
+    db_root : str
+        Database directory.
+    table : str
+        Table name within each partition.
+    partition_col : str, default 'date'
+        Date or integer column to partition by. Nulls are not allowed.
+    parted_col : str, optional
+        Column to sort each partition by and mark with the parted
+        attribute, e.g. 'sym', so selections and groupings on it touch
+        contiguous ranges.
+
+    Returns
+    -------
+    str
+        Success message listing the number of partitions written.
+    """
+    try:
+        q_table = _ensure_q_table(df)
+        if isinstance(q_table, kx.KeyedTable):
+            q_table = _q_func('unkey')(q_table)
+        _validate_columns(q_table, [partition_col] + ([parted_col] if parted_col else []))
+        if parted_col == partition_col:
+            raise ValueError("parted_col must differ from partition_col")
+
+        col_type = _q_func('col_type')(q_table, kx.SymbolAtom(partition_col)).py()
+        if col_type not in _PARTITION_TYPES:
+            raise ValueError(f"Partition column '{partition_col}' must be a date or integer column")
+
+        os.makedirs(db_root, exist_ok=True)
+        written = _q_func('write_partitions')(
+            _hsym(db_root), kx.SymbolAtom(table), kx.SymbolAtom(partition_col),
+            kx.SymbolAtom(parted_col or ''), q_table,
+        )
+        return f"Table saved to: {db_root} ({len(written)} partitions)"
+    except Exception as e:
+        raise RuntimeError(f"Failed to save partitioned table to {db_root}: {e}")
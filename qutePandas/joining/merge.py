@@ -1,8 +1,9 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
 
 
+@_instrument
 def merge(left, right, how='inner', on=None, left_on=None, right_on=None, left_index=False, right_index=False, sort=False, return_type="q"):
     """
     Merge DataFrame or pykx.Table objects with a database-style join.
@@ -28,7 +29,7 @@ def merge(left, right, how='inner', on=None, left_on=None, right_on=None, left_i
     sort : bool, default False
         Sort the join keys lexicographically in the result DataFrame. (Currently not fully supported)
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -56,36 +57,37 @@ def merge(left, right, how='inner', on=None, left_on=None, right_on=None, left_i
             r_keys = [r_keys]
 
         if l_keys != r_keys:
-            update_clauses = []
-            for lk, rk in zip(l_keys, r_keys):
-                if lk != rk:
-                    update_clauses.append(f"{lk}:{rk}")
+            renames = [(lk, rk) for lk, rk in zip(l_keys, r_keys) if lk != rk]
             
-            if update_clauses:
-                update_str = ",".join(update_clauses)
-                q_right = kx.q(f"{{update {update_str} from x}}", q_right)
+            if renames:
+                q_right = _q_func('copy_cols')(
+                    q_right,
+                    kx.SymbolVector([lk for lk, _ in renames]),
+                    kx.SymbolVector([rk for _, rk in renames])
+                )
             
             r_keys = l_keys
 
-        key_cols = "`" + "`".join(l_keys)
+        key_cols = kx.SymbolVector(l_keys)
+        xkey = _q_func('xkey')
 
         if how == 'inner':
-            keyed_right = kx.q(f'{{ {key_cols} xkey x }}', q_right)
-            result = kx.q("{x ij y}", q_left, keyed_right)
+            keyed_right = xkey(q_right, key_cols)
+            result = _q_func('ij')(q_left, keyed_right)
         elif how == 'left':
-            keyed_right = kx.q(f'{{ {key_cols} xkey x }}', q_right)
-            result = kx.q("{x lj y}", q_left, keyed_right)
+            keyed_right = xkey(q_right, key_cols)
+            result = _q_func('lj')(q_left, keyed_right)
         elif how == 'right':
-            keyed_left = kx.q(f'{{ {key_cols} xkey x }}', q_left)
-            result = kx.q("{x lj y}", q_right, keyed_left)
+            keyed_left = xkey(q_left, key_cols)
+            result = _q_func('lj')(q_right, keyed_left)
             left_all_cols = kx.q("cols", q_left).py()
             right_all_cols = kx.q("cols", q_right).py()
-            target_cols = "`" + "`".join(left_all_cols + [c for c in right_all_cols if c not in left_all_cols])
-            result = kx.q(f"{{ {target_cols} xcols x }}", result)
+            target_cols = left_all_cols + [c for c in right_all_cols if c not in left_all_cols]
+            result = _q_func('xcols')(result, kx.SymbolVector(target_cols))
         elif how == 'outer':
-            keyed_left = kx.q(f'{{ {key_cols} xkey x }}', q_left)
-            keyed_right = kx.q(f'{{ {key_cols} xkey x }}', q_right)
-            result = kx.q("{0! x uj y}", keyed_left, keyed_right)
+            keyed_left = xkey(q_left, key_cols)
+            keyed_right = xkey(q_right, key_cols)
+            result = _q_func('uj')(keyed_left, keyed_right)
         else:
             raise ValueError(f"Invalid how: {how}. Must be one of 'left', 'right', 'outer', 'inner'.")
 
@@ -1,8 +1,20 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
 
+_Q_TYPE_MAP = {
+    'int64': 'j', 'int32': 'i', 'int': 'i', 'long': 'j',
+    'float64': 'f', 'float32': 'e', 'float': 'f', 'real': 'e',
+    'object': 's', 'string': 'C', 'str': 'C',
+    'j': 'j', 'i': 'i', 'h': 'h', 'f': 'f', 'e': 'e', 's': 's', 'c': 'c'
+}
 
+_TYPE_CODES = {
+    'j': 7, 'i': 6, 'h': 5, 'f': 9, 'e': 8, 's': 11, 'c': 10, 'b': 1
+}
+
+
+@_instrument
 def cast(df, col, dtype, return_type='q'):
     """
     Converts column to specified data type.
@@ -16,7 +28,7 @@ def cast(df, col, dtype, return_type='q'):
     dtype : str
         Target data type ('i' for int, 'f' for float, 's' for symbol, etc.).
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -24,24 +36,15 @@ def cast(df, col, dtype, return_type='q'):
         DataFrame with column cast to new type.
     """
     try:
-        q_map = {
-            'int64': 'j', 'int32': 'i', 'int': 'i', 'long': 'j',
-            'float64': 'f', 'float32': 'e', 'float': 'f', 'real': 'e',
-            'object': 's', 'string': 'C', 'str': 'C',
-            'j': 'j', 'i': 'i', 'h': 'h', 'f': 'f', 'e': 'e', 's': 's', 'c': 'c'
-        }
-
-        q_type = q_map.get(dtype, dtype)
+        q_type = _Q_TYPE_MAP.get(dtype, dtype)
         q_table = _ensure_q_table(df)
 
         if len(q_type) != 1:
             raise ValueError(f"Unsupported q cast type: {dtype}")
 
-        curr_type = kx.q(f'{{type x`{col}}}', q_table).py()
-        type_to_code = {
-            'j': 7, 'i': 6, 'h': 5, 'f': 9, 'e': 8, 's': 11, 'c': 10, 'b': 1
-        }
-        target_code = type_to_code.get(q_type.lower())
+        q_col = kx.SymbolAtom(col)
+        curr_type = _q_func('col_type')(q_table, q_col).py()
+        target_code = _TYPE_CODES.get(q_type.lower())
 
         if target_code is not None and abs(curr_type) == target_code:
             return _handle_return(q_table, return_type)
@@ -50,20 +53,11 @@ def cast(df, col, dtype, return_type='q'):
         q_char = q_type.upper() if is_parsing else q_type.lower()
 
         if q_char.lower() == 's':
-            result = kx.q(
-                f'{{update {col}:`$ string {col} from x}}',
-                q_table
-            )
+            result = _q_func('cast_sym')(q_table, q_col)
         elif q_char in ('i', 'j'):
-            result = kx.q(
-                f'{{update {col}:"{q_char}"$(({col}>=0)*floor {col} + ({col}<0)*ceiling {col}) from x}}',
-                q_table
-            )
+            result = _q_func('cast_round')(q_table, q_col, kx.CharAtom(q_char))
         else:
-            result = kx.q(
-                f'{{update {col}:"{q_char}"${col} from x}}',
-                q_table
-            )
+            result = _q_func('cast')(q_table, q_col, kx.CharAtom(q_char))
 
         return _handle_return(result, return_type)
 
@@ -1,8 +1,9 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return, _validate_columns
+from ..utils import _ensure_q_table, _handle_return, _validate_columns, _instrument
 
 
+@_instrument
 def drop_col(df, cols, return_type='q'):
     """
     Removes specified column(s) from the DataFrame.
@@ -14,7 +15,7 @@ def drop_col(df, cols, return_type='q'):
     cols : list of str or str
         Column names to drop.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -37,9 +38,14 @@ def drop_col(df, cols, return_type='q'):
         
         all_cols = kx.q("cols", q_table).py()
         if len(cols) == len(all_cols):
-            if return_type == 'p':
+            if return_type in ('p', 'l'):
                 count = kx.q('count', q_table).py()
                 return pd.DataFrame(index=range(count))
+            elif return_type == 'n':
+                return {}
+            elif return_type == 'a':
+                import pyarrow as pa
+                return pa.table({})
             else:
                 result = kx.q('(0#`)!()')
                 return result
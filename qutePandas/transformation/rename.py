@@ -1,8 +1,9 @@
 import pykx as kx
 import pandas as pd
-from ..utils import _ensure_q_table, _handle_return
+from ..utils import _ensure_q_table, _handle_return, _q_func, _instrument
 
 
+@_instrument
 def rename(df, columns, return_type='q'):
     """
     Renames columns in the DataFrame.
@@ -14,7 +15,7 @@ def rename(df, columns, return_type='q'):
     columns : dict
         Dictionary mapping old column names to new column names.
     return_type : str, default 'q'
-        Desired return type ('p' or 'q').
+        Desired return type ('p', 'q', 'a', 'n' or 'l').
 
     Returns
     -------
@@ -26,9 +27,8 @@ def rename(df, columns, return_type='q'):
         
         cols = kx.q("cols", q_table).py()
         new_cols = [columns.get(c, c) for c in cols]
-        new_cols_str = "`" + "`".join(new_cols)
         
-        result = kx.q(f'{new_cols_str} xcol', q_table)
+        result = _q_func('xcol')(q_table, kx.SymbolVector(new_cols))
         return _handle_return(result, return_type)
     except Exception as e:
         raise RuntimeError(f"Failed to rename columns: {e}")
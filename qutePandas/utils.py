@@ -1,28 +1,420 @@
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
 import pykx as kx
 import pandas as pd
 import numpy as np
 
-def _ensure_q_table(data):
+# Parameterised q lambdas shared by the public functions. Column names and
+# values are passed as arguments (never spliced into source), and each lambda
+# is parsed once per process by _q_func. Column-wise and per-group work uses
+# peach, which spreads across secondary threads when q runs with -s and falls
+# back to each otherwise. Per-element application (each_col) splits the
+# column into one chunk per thread with .Q.fc and runs each over a chunk, so
+# dispatch is per chunk rather than per element.
+# Reads columns c of table n from partition v of the database at r, adding
+# the virtual partition column p when it is requested.
+_PART_READ = ("{[r;n;p;c;v] t:get ` sv r,(`$string v),n,`; u:c except p;"
+              "s:$[count u; ?[t;();0b;u!u]; flip(enlist p)!enlist count[t]#v];"
+              "$[(p in c)&0<count u; c xcols ![s;();0b;(enlist p)!enlist v]; s]}")
+
+# Loads the sym file of database root r into the q global sym, skipping the
+# load when sym already holds that root's file at its current size. Every
+# read calls it just before de-enumerating, so results never depend on which
+# root was loaded last. Writers clear the key since .Q.en reloads sym.
+_LOAD_SYM = ("{[r] f:` sv r,`sym; if[not ()~key f; k:(r;hcount f);"
+             "if[not k~@[get;`.qpd.symKey;()]; load f; .qpd.symKey:k]]}")
+
+# Expands a LazyFrame expression node (template; x; y) into a parse tree,
+# substituting the expanded x and y for the `x`/`y` placeholders.
+_LAZY_EXPR = ("{[e] $[(0h=type e) and 10h=type first e;"
+              "{[m;e] $[-11h=type e; $[e in key m; m e; e]; 0h=type e; .z.s[m] each e; e]}"
+              "[`x`y!.z.s each 1_e] parse first e; e]}")
+
+_Q_LAMBDAS = {
+    'get_col': "{[t;c] t c}",
+    'col_type': "{[t;c] type t c}",
+    'fill': "{[t;c;v] ![t;();0b;c!{(^;$[-11h=type x;enlist x;x];y)}'[v;c]]}",
+    'fill_dir': "{[t;c;b;d;k] f:{[k;x] r:fills x; $[null k; r; @[r;where k<(til count x)-fills ?[null x;0N;til count x];:;x 0N]]};"
+                "g:$[d=`bfill; {[f;k;x] reverse f[k] reverse x}[f]; f]; ![t;();$[count b;b!b;0b];c!{(x;y;z)}[g;k] each c]}",
+    'set_col': "{[t;c;v] ![t;();0b;(enlist c)!enlist enlist v]}",
+    'each_col': "{[t;c;f] ![t;();0b;(enlist c)!enlist(.Q.fc[{[f;x] f each x}[f]];c)]}",
+    'head': "{[t;n] n sublist t}",
+    'each_row': "{[t;f] f each t}",
+    'each_column': "{[t;f] (cols t)!f peach value flip t}",
+    'cast_sym': "{[t;c] ![t;();0b;(enlist c)!enlist($;enlist`;(string;c))]}",
+    'cast_round': "{[t;c;q] ![t;();0b;(enlist c)!enlist($;q;(*;(not;(<;c;0));(floor;(+;c;(*;(<;c;0);(ceiling;c))))))]}",
+    'cast': "{[t;c;q] ![t;();0b;(enlist c)!enlist($;q;c)]}",
+    'text_cols': "{[t;c;k] ![t;();0b;c!{[t;x;y] $[y=`s; $[11h=type t x; x; ($;enlist`;x)];"
+                 "$[11h=type t x; (string;x); x]]}[t]'[c;k]]}",
+    'group_sum': "{[t;b;c] $[(0<system\"s\")&0<count t; b xasc 0!(key g)!flip(enlist c)!enlist"
+                 "{sum x y}[t c] peach value g:group ?[t;();0b;b!b]; 0!?[t;();b!b;(enlist c)!enlist(sum;c)]]}",
+    'group_avg': "{[t;b;c] $[(0<system\"s\")&0<count t; b xasc 0!(key g)!flip(enlist c)!enlist"
+                 "{avg x y}[t c] peach value g:group ?[t;();0b;b!b]; 0!?[t;();b!b;(enlist c)!enlist(avg;c)]]}",
+    'drop_nulls': "{[t;c;h;k] n:count c; c:c where not(type each(0!t)c)in 1 4h; k-:n-count c;"
+                  "e:{$[0h=type x y; (each;all;(null;y)); (null;y)]}[0!t] each c;"
+                  "w:$[not null k; $[k<1; (); 0=count e; enlist(<;`i;0); enlist(not;(<;(sum;enlist,{(not;x)} each e);k))];"
+                  "0=count e; (); h=`all; enlist(not;(all;enlist,e)); {(not;x)} each e];"
+                  "?[t;w;0b;()]}",
+    'group_partial': "{[t;b;c] 0!?[t;();b!b;(()!()),/{n:`$string[x],/:(\"__sum\";\"__count\";\"__min\";\"__max\";\"__sumsq\");"
+                     "f:($;9h;x); n!((sum;x);(sum;($;7h;(not;(null;x))));(min;x);(max;x);(sum;(*;f;f)))}each c]}",
+    'group_merge': "{[p;b;c] 0!?[raze p;();b!b;(()!()),/{n:`$string[x],/:(\"__sum\";\"__count\";\"__min\";\"__max\";\"__sumsq\");"
+                   "n!((sum;n 0);(sum;n 1);(min;n 2);(max;n 3);(sum;n 4))}each c]}",
+    'group_final': "{[p;b;o;c;a] ?[p;();0b;(b!b),o!{[x;y] n:`$string[x],/:(\"__sum\";\"__count\";\"__min\";\"__max\";\"__sumsq\");"
+                   "s:($;9h;n 0); v:(%;(-;n 4;(%;(*;s;s);n 1));(-;n 1;1));"
+                   "$[y=`sum;n 0;y=`count;n 1;y=`min;n 2;y=`max;n 3;y=`mean;(%;n 0;n 1);y=`var;v;(sqrt;v)]}'[c;a]]}",
+    'interp': "{[t;c;b;k;o] f:{[k;x;y] d:12 13 14 16 17 18 19h; w:type y; m:not null y; n:count y;"
+              "x:\"f\"$$[(type x)in d; \"j\"$x; x]; v:\"f\"$$[w in d; \"j\"$y; y];"
+              "i:?[m;til n;0N]; p:fills i; s:reverse fills reverse i; x0:x p; x1:x s; y0:v p; y1:v s;"
+              "r:y0^?[m; v; $[k=`nearest; ?[(x-x0)>x1-x; y1; y0]; y0+(y1-y0)*(x-x0)%x1-x0]];"
+              "$[w in d; w$\"j\"$r; (w in 5 6 7h)&k<>`nearest; r; w$r]};"
+              "![t;();$[count b;b!b;0b];c!{[f;k;o;c] (f;enlist k;$[null o;(til;(count;c));o];c)}[f;k;o] each c]}",
+    'dup_mask': "{[t;c;k] v:$[1=count c; (0!t) first c; flip c!(0!t) c]; n:count v;"
+                "$[k=`first; (til n)<>v?v; k=`last; reverse(til n)<>r?r:reverse v;"
+                "@[n#0b;raze g where 1<count each g:value group v;:;1b]]}",
+    'drop_mask': "{[t;m] ?[t;enlist not m;0b;()]}",
+    'copy_cols': "{[t;l;r] ![t;();0b;l!r]}",
+    'splay': "{[p;d;t] .qpd.symKey:(); p set .Q.en[d] t}",
+    'load_splay': "{[p;d;m] " + _LOAD_SYM + "[d]; t:get p;"
+                  "flip {[m;x] $[20h=type x; value x; m; x; x til count x]}[m] each flip t}",
+    'load_sym': _LOAD_SYM,
+    'splay_cols': "{[p] cols get p}",
+    'write_partitions': "{[d;n;p;k;t] if[any null t p; '\"null partition values\"]; g:group t p;"
+                        "{[d;n;p;k;t;v;i] s:![t i;();0b;enlist p]; if[not null k; s:@[k xasc s;k;`p#]];"
+                        "f:` sv d,(`$string v),n; if[11h=type key f; hdel each ` sv/:f,/:key f];"
+                        ".qpd.symKey:(); (` sv f,`) set .Q.en[d] s}[d;n;p;k;t]'[key g;value g]; asc key g}",
+    'part_select': "{[r;n;p;c;v] " + _LOAD_SYM + "[r]; flip {$[20h=type x; value x; x]} each flip raze "
+                   + _PART_READ + "[r;n;p;c] peach v}",
+    'part_group': "{[g;r;n;p;b;a;v] " + _LOAD_SYM + "[r]; {flip {$[20h=type x; value x; x]} each flip x} each "
+                  "{[g;r;n;p;b;a;v] g[" + _PART_READ + "[r;n;p;distinct b,a;v];b;a]}[g;r;n;p;b;a] peach v}",
+    'set_global': "{[n;t] n set t}",
+    'append_global': "{[n;t] n upsert t}",
+    'pop_global': "{[n] r:get n; ![`.qpd;();0b;enlist last` vs n]; r}",
+    'unkey': "{[t] 0!t}",
+    'data_cols': "{[t] cols 0!t}",
+    'set_threads': "{[n] system \"s \",string n}",
+    'xkey': "{[t;k] k xkey t}",
+    'ij': "{[l;r] l ij r}",
+    'lj': "{[l;r] l lj r}",
+    'uj': "{[l;r] 0!l uj r}",
+    'xcol': "{[t;c] c xcol t}",
+    'xcols': "{[t;c] c xcols t}",
+    'lazy_run': "{[t;s] {[e;t;s] 0!?[t;e each s 0;$[99h=type s 1;e each s 1;s 1];e each s 2]}["
+                + _LAZY_EXPR + "]/[t;s]}",
+    'col_bytes': "{[t;d] ([] column:cols t; bytes:{[d;c] $[11h<>type c; -22!c;"
+                 "(-22!0#c)+(8*count c)+$[d; sum 1+count each string distinct c; 0]]}[d] each value flip t)}",
+}
+
+_q_func_cache = {}
+
+
+def _q_func(name):
     """
-    Ensures input data is a kdb+ table.
+    Returns the registered q lambda, compiling it on first use.
     """
+    fn = _q_func_cache.get(name)
+    if fn is None:
+        fn = _q_func_cache[name] = kx.q(_Q_LAMBDAS[name])
+    return fn
+
+
+def _hsym(path, directory=False):
+    """
+    Returns the q file symbol for a local path, with a trailing slash for
+    directories written with set.
+    """
+    path = os.path.abspath(path)
+    return kx.SymbolAtom(':' + path + ('/' if directory else ''))
+
+class _ConversionCache:
+    """
+    LRU cache of pandas -> q conversions, keyed weakly on DataFrame identity.
+
+    Each entry stores a cheap fingerprint of the frame (shape, labels,
+    dtypes, the buffer address of each column and a hash of up to
+    ``_SAMPLE_ROWS`` evenly spaced rows) that is checked on every lookup, so
+    reassigning columns or editing sampled rows invalidates the entry. Its
+    cost does not grow with the row count. In-place edits to other rows are
+    not detected; call ``clear_conversion_cache`` after such mutations.
+    """
+
+    _SAMPLE_ROWS = 16
+
+    def __init__(self, max_bytes, max_entries):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Keys of collected frames. Weakref callbacks can fire on a thread
+        # that already holds the lock, so they only queue the key here and
+        # the next locked call purges it.
+        self._dead = deque()
+
+    @staticmethod
+    def _buffer(col):
+        # NumPy-backed columns are identified by their data pointer,
+        # extension arrays by object identity; both change on reassignment.
+        if isinstance(col.dtype, np.dtype):
+            return col.to_numpy(copy=False).__array_interface__['data'][0]
+        return id(col.array)
+
+    @classmethod
+    def _fingerprint(cls, df):
+        n = len(df)
+        rows = np.unique(np.linspace(0, n - 1, num=min(n, cls._SAMPLE_ROWS)).astype(np.int64))
+        sample = pd.util.hash_pandas_object(df.iloc[rows], index=True).to_numpy().tobytes()
+        buffers = tuple(cls._buffer(col) for _, col in df.items())
+        return (df.shape, tuple(df.columns), tuple(str(t) for t in df.dtypes), buffers, sample)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[3]
+
+    def _on_collect(self, key):
+        self._dead.append(key)
+
+    def _purge(self):
+        while self._dead:
+            key = self._dead.popleft()
+            entry = self._entries.get(key)
+            # The id may already belong to a newer frame.
+            if entry is not None and entry[0]() is None:
+                self._discard(key)
+
+    def get(self, df):
+        try:
+            fingerprint = self._fingerprint(df)
+        except TypeError:
+            # Unhashable cell values (lists, dicts): convert without caching.
+            return kx.toq(df)
+
+        key = id(df)
+        with self._lock:
+            self._purge()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is df and entry[1] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self._discard(key)
+            self.misses += 1
+
+        q_table = kx.toq(df)
+        # deep=True counts the Python strings behind object and string
+        # columns, which a shallow count reports as 8-byte pointers.
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return q_table
+
+        ref = weakref.ref(df, lambda _, key=key: self._on_collect(key))
+        with self._lock:
+            self._purge()
+            self._discard(key)
+            self._entries[key] = (ref, fingerprint, q_table, nbytes)
+            self.nbytes += nbytes
+            while self._entries and (self.nbytes > self.max_bytes or len(self._entries) > self.max_entries):
+                self._discard(next(iter(self._entries)))
+        return q_table
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dead.clear()
+            self.nbytes = 0
+
+    def info(self):
+        with self._lock:
+            self._purge()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'max_entries': self.max_entries,
+            }
+
+
+# Disabled unless enable_conversion_cache() is called.
+_conversion_cache = None
+
+_log = logging.getLogger(__name__)
+
+# Profiling hooks: callables that receive one record dict per finished
+# instrumented call. Nothing is measured while the list is empty.
+_profile_hooks = []
+_profile_state = threading.local()
+
+# Zero-argument checks run after every instrumented call without the
+# profiling record (used by set_gc_policy).
+_post_call_checks = []
+
+
+def _current_record():
+    stack = getattr(_profile_state, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def _q_heap():
+    try:
+        return kx.q(".Q.w[]").py()
+    except Exception:
+        return None
+
+
+def _run_hooks(hooks, *args):
+    """
+    Calls each hook, logging failures so they never replace the call's
+    own result or exception.
+    """
+    for hook in list(hooks):
+        try:
+            hook(*args)
+        except Exception:
+            _log.exception("qutePandas hook %r failed", hook)
+
+
+def _instrument(func):
+    """
+    Records per-call phase timings, row counts and q heap usage for hooks.
+
+    Wall time is split into pandas -> q conversion (_ensure_q_table),
+    q -> Python conversion (_handle_return) and the remainder, which is
+    attributed to q execution.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _profile_hooks:
+            if not _post_call_checks:
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _run_hooks(_post_call_checks)
+
+        record = {
+            'function': name, 'wall_s': 0.0, 'to_q_s': 0.0, 'q_s': 0.0, 'to_python_s': 0.0,
+            'rows_in': 0, 'rows_out': None, 'return_type': None,
+            'q_heap_used': None, 'q_heap_peak': None, 'error': None,
+        }
+        if not hasattr(_profile_state, 'stack'):
+            _profile_state.stack = []
+        heap_before = _q_heap()
+        _profile_state.stack.append(record)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            record['error'] = str(e)
+            raise
+        finally:
+            record['wall_s'] = time.perf_counter() - start
+            _profile_state.stack.pop()
+            record['q_s'] = max(record['wall_s'] - record['to_q_s'] - record['to_python_s'], 0.0)
+            heap_after = _q_heap()
+            if heap_before and heap_after:
+                record['q_heap_used'] = heap_after['used'] - heap_before['used']
+                record['q_heap_peak'] = heap_after['peak']
+            _run_hooks(_profile_hooks, record)
+            _run_hooks(_post_call_checks)
+
+    return wrapper
+
+
+def _convert_to_q(data):
     if isinstance(data, (kx.Table, kx.KeyedTable)):
         return data
     elif isinstance(data, pd.DataFrame):
+        cache = _conversion_cache
+        if cache is not None:
+            return cache.get(data)
         return kx.toq(data)
     else:
         raise ValueError("Input must be a pandas DataFrame or pykx Table")
 
+
+def _ensure_q_table(data):
+    """
+    Ensures input data is a kdb+ table.
+    """
+    record = _current_record()
+    if record is None:
+        return _convert_to_q(data)
+
+    start = time.perf_counter()
+    q_table = _convert_to_q(data)
+    record['to_q_s'] += time.perf_counter() - start
+    record['rows_in'] += len(q_table)
+    return q_table
+
+def _to_numpy(q_object):
+    """
+    Converts a q object to NumPy, table columns becoming a dict of arrays.
+
+    Numeric, boolean and char vectors are returned as views over q memory;
+    symbol and temporal columns are copied by the conversion.
+    """
+    if isinstance(q_object, kx.KeyedTable):
+        q_object = _q_func('unkey')(q_object)
+    if isinstance(q_object, kx.Table):
+        get_col = _q_func('get_col')
+        return {c: get_col(q_object, kx.SymbolAtom(c)).np() for c in kx.q("cols", q_object).py()}
+    if isinstance(q_object, kx.Dictionary):
+        return dict(zip(kx.q("key", q_object).py(), kx.q("value", q_object).np()))
+    return q_object.np()
+
+
 def _handle_return(q_object, return_type='q'):
     """
     Handles return value based on specified return type.
+
+    'q' returns the kdb+ object, 'p' converts to pandas, 'a' converts to
+    pyarrow (keyed tables are unkeyed first), 'n' converts to NumPy and 'l'
+    wraps tables in a LazyDataFrame that converts columns on first access.
     """
+    record = _current_record()
+    if record is None:
+        return _convert_return(q_object, return_type)
+
+    start = time.perf_counter()
+    result = _convert_return(q_object, return_type)
+    record['to_python_s'] += time.perf_counter() - start
+    record['return_type'] = return_type
+    if isinstance(q_object, (kx.Table, kx.KeyedTable)):
+        record['rows_out'] = len(q_object)
+    return result
+
+
+def _convert_return(q_object, return_type):
     if return_type == 'p':
         return q_object.pd()
     elif return_type == 'q':
         return q_object
+    elif return_type == 'a':
+        if isinstance(q_object, kx.KeyedTable):
+            q_object = _q_func('unkey')(q_object)
+        return q_object.pa()
+    elif return_type == 'n':
+        return _to_numpy(q_object)
+    elif return_type == 'l':
+        if isinstance(q_object, kx.Table):
+            from .core.proxy import LazyDataFrame
+            return LazyDataFrame(q_object)
+        return q_object.pd()
     else:
-        raise ValueError(f"Invalid return_type: {return_type}. Must be 'p' or 'q'.")
+        raise ValueError(f"Invalid return_type: {return_type}. Must be 'p', 'q', 'a', 'n' or 'l'.")
+
 
 def _validate_columns(q_table, cols):
     """
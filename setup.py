@@ -11,7 +11,7 @@ setup(
         'pykx>=2.0.0',
         'pandas>=1.3.0',
         'numpy>=1.20.0',
-        'pyarrow>=10.0.0',
+        'pyarrow>=14.0.0',
     ],
     author="Isha Patro",
     author_email="ishapatro21@gmail.com",
@@ -24,12 +24,11 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Topic :: Database",
     ],
-    python_requires='>=3.7',
+    python_requires='>=3.8',
     license_files=[],
 )
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for qutePandas.
+
+Runs ``python -X importtime -c "import qutePandas"`` in a fresh interpreter and
+verifies that importing the package stays cheap: the heavy dependencies
+(pykx, pandas, pyarrow) must only load when a function is first used.
+
+Run with pytest, or directly: python tests/test_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative microseconds allowed for `import qutePandas` itself.
+IMPORT_BUDGET_US = 50_000
+
+DEFERRED_MODULES = ("pykx", "pandas", "pyarrow")
+
+
+def _import_profile(statement="import qutePandas"):
+    """Return {module: cumulative_us} from -X importtime for a statement."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, env=dict(os.environ),
+    )
+    assert proc.returncode == 0, proc.stderr
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        profile[module.strip()] = int(cumulative)
+    return profile
+
+
+def test_import_within_budget():
+    profile = _import_profile()
+    assert profile["qutePandas"] <= IMPORT_BUDGET_US, (
+        f"import qutePandas took {profile['qutePandas']} us (budget {IMPORT_BUDGET_US} us)"
+    )
+
+
+def test_heavy_dependencies_deferred():
+    profile = _import_profile()
+    loaded = [m for m in DEFERRED_MODULES if m in profile]
+    assert not loaded, f"imported eagerly by qutePandas: {loaded}"
+
+
+def test_public_api_resolves():
+    proc = subprocess.run(
+        [sys.executable, "-c",
+         "import qutePandas as qpd, types; "
+         "assert all(not isinstance(getattr(qpd, n), types.ModuleType) for n in qpd.__all__)"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+if __name__ == "__main__":
+    profile = _import_profile()
+    print(f"import qutePandas: {profile['qutePandas']} us (budget {IMPORT_BUDGET_US} us)")
+    test_import_within_budget()
+    test_heavy_dependencies_deferred()
+    test_public_api_resolves()
+    print("Import-time checks passed.")
@@ -4,28 +4,10 @@ import pykx as kx
 import time
 import gc
 import random
-import string
 
 def generate_large_dataset(rows=10_000_000, cols=20, null_percentage=0.1, seed=42):
-    np.random.seed(seed)
-    random.seed(seed)
-    data = {}
-    for i in range(cols):
-        col_name = f'col_{i}'
-        if i % 5 == 0: data[col_name] = np.random.randint(1, 1000, rows)
-        elif i % 5 == 1: data[col_name] = np.random.uniform(0, 100, rows)
-        elif i % 5 == 2:
-            pool = [''.join(random.choices(string.ascii_letters, k=5)) for _ in range(100)]
-            data[col_name] = np.random.choice(pool, rows)
-        elif i % 5 == 3: data[col_name] = np.random.choice(['A', 'B', 'C', 'D'], rows)
-        else: data[col_name] = np.random.randn(rows)
-    df = pd.DataFrame(data)
-    if null_percentage > 0:
-        for col in df.columns:
-            mask = np.random.rand(rows) < null_percentage
-            if df[col].dtype.kind in 'if': df.loc[mask, col] = np.nan
-            else: df.loc[mask, col] = None
-    return df
+    from qutePandas.bench import generate_dataset
+    return generate_dataset(rows, cols=cols, null_fraction=null_percentage, seed=seed)
 
 def benchmark_operation(func, iterations=5, warmup=True, seed=42):
     if warmup: